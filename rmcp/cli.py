@@ -525,6 +525,8 @@ def check_r_packages():
     """Check R package installation status."""
     import subprocess
 
+    from .r_integration import get_r_binary_path
+
     # Define all required packages with their categories
     packages = {
         "Core Statistical": ["jsonlite", "plm", "lmtest", "sandwich", "AER", "dplyr"],
@@ -544,10 +546,11 @@ def check_r_packages():
     }
     click.echo("🔍 Checking R Package Installation Status")
     click.echo("=" * 50)
-    # Check if R is available
+    # Check if R is available; the resolved binary is reused for every package
     try:
+        r_binary = get_r_binary_path()
         result = subprocess.run(
-            ["R", "--version"], capture_output=True, text=True, timeout=10
+            [r_binary, "--version"], capture_output=True, text=True, timeout=10
         )
         if result.returncode != 0:
             click.echo("❌ R not found. Please install R first.")
@@ -569,7 +572,7 @@ def check_r_packages():
                 # Check if package is installed
                 r_cmd = f'if (require("{pkg}", quietly=TRUE)) cat("INSTALLED") else cat("MISSING")'
                 result = subprocess.run(
-                    ["R", "--slave", "-e", r_cmd],
+                    [r_binary, "--slave", "-e", r_cmd],
                     capture_output=True,
                     text=True,
                     timeout=10,
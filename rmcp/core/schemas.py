@@ -9,7 +9,8 @@ Provides utilities for:
 from typing import Any
 
 from jsonschema import ValidationError as JsonSchemaValidationError
-from jsonschema import validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 
 class SchemaError(Exception):
@@ -21,13 +22,42 @@ class SchemaError(Exception):
         self.code = -32602  # JSON-RPC invalid params error
 
 
+# Compiled validators keyed by schema identity. Each entry keeps its schema
+# alive, so an id() cannot be recycled while it is cached; the bound only
+# matters for callers that build throwaway schemas.
+_VALIDATOR_CACHE: dict[int, tuple[dict[str, Any], Any]] = {}
+_VALIDATOR_CACHE_SIZE = 512
+
+
+def _get_validator(schema: dict[str, Any]) -> Any:
+    """Return a validator for ``schema``, checking and compiling it only once."""
+    cached = _VALIDATOR_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    if len(_VALIDATOR_CACHE) >= _VALIDATOR_CACHE_SIZE:
+        _VALIDATOR_CACHE.clear()
+    _VALIDATOR_CACHE[id(schema)] = (schema, validator)
+    return validator
+
+
 def validate_schema(data: Any, schema: dict[str, Any], context: str = "") -> None:
     """
     Validate data against JSON schema.
     Raises SchemaError with MCP-compatible error code on failure.
+
+    Schemas are treated as immutable once validated against: tool and prompt
+    schemas are built once at registration, and their compiled validators are
+    reused for every call.
     """
     try:
-        validate(instance=data, schema=schema)
+        # Same semantics as jsonschema.validate, minus the per-call meta-schema
+        # check and validator construction.
+        error = best_match(_get_validator(schema).iter_errors(data))
+        if error is not None:
+            raise error
     except JsonSchemaValidationError as e:
         field_path = ".".join(str(p) for p in e.absolute_path)
         error_context = f" in {context}" if context else ""
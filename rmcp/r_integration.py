@@ -34,6 +34,11 @@ from typing import Any
 from .config import get_config
 from .logging_config import get_logger, log_r_execution
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib decoder is the fallback
+    orjson = None
+
 logger = get_logger(__name__)
 
 # One R-process limiter per event loop. A single module-level Semaphore would
@@ -58,6 +63,24 @@ def get_r_semaphore() -> asyncio.Semaphore:
 _R_BINARY_PATH = None
 
 
+def _load_r_result(path: str) -> Any:
+    """Parse the JSON result file written by an R script.
+
+    Uses orjson when it is installed. Its errors subclass
+    json.JSONDecodeError, and anything it rejects (e.g. NaN literals) is
+    handed to the stdlib parser, so callers see the same results and errors
+    either way.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
 def get_r_binary_path() -> str:
     """
     Discover and cache the R binary path.
@@ -158,7 +181,7 @@ def check_r_version() -> tuple[bool, str]:
     """
     try:
         result = subprocess.run(
-            ["R", "--version"],
+            [get_r_binary_path(), "--version"],
             capture_output=True,
             text=True,
             timeout=get_config().r.version_check_timeout,
@@ -377,8 +400,7 @@ Original error: {stderr.strip()}"""
                 )
             # Read results
             try:
-                with open(result_path) as f:
-                    result = json.load(f)
+                result = _load_r_result(result_path)
                 logger.debug(f"R script executed successfully, result: {result}")
                 return result
             except FileNotFoundError:
@@ -738,29 +760,25 @@ Original error:
                     )
                 # Read and parse results
                 try:
-                    with open(result_path) as f:
-                        result_json = f.read()
-                        result = json.loads(result_json)
-                        result_info = (
-                            list(result.keys())
-                            if isinstance(result, dict)
-                            else type(result)
-                        )
-                        # Log structured R execution completion
-                        execution_time_ms = int((time.time() - start_time) * 1000)
-                        log_r_execution(
-                            logger,
-                            r_command=script[:100] + "..."
-                            if len(script) > 100
-                            else script,
-                            execution_time_ms=execution_time_ms,
-                            success=True,
-                        )
+                    result = _load_r_result(result_path)
+                    result_info = (
+                        list(result.keys())
+                        if isinstance(result, dict)
+                        else type(result)
+                    )
+                    # Log structured R execution completion
+                    execution_time_ms = int((time.time() - start_time) * 1000)
+                    log_r_execution(
+                        logger,
+                        r_command=script[:100] + "..." if len(script) > 100 else script,
+                        execution_time_ms=execution_time_ms,
+                        success=True,
+                    )
 
-                        logger.debug(
-                            f"R script completed successfully, result keys: {result_info}"
-                        )
-                        return result
+                    logger.debug(
+                        f"R script completed successfully, result keys: {result_info}"
+                    )
+                    return result
                 except (FileNotFoundError, json.JSONDecodeError) as e:
                     # Log structured R execution failure
                     execution_time_ms = int((time.time() - start_time) * 1000)
@@ -8,6 +8,7 @@ Provides:
 Following the principle: "Registries are discoverable and testable."
 """
 
+import functools
 import inspect
 import json
 import time
@@ -115,20 +116,43 @@ class ToolsRegistry:
         annotations: dict[str, Any] | None = None,
     ) -> None:
         """Register a tool with the registry."""
+        self._add(
+            ToolDefinition(
+                name=name,
+                handler=handler,
+                input_schema=input_schema,
+                output_schema=output_schema,
+                title=title or name,
+                description=description or f"Execute {name}",
+                annotations=annotations or {},
+            )
+        )
+
+    def _add(self, tool_def: ToolDefinition) -> None:
+        """Insert a built definition and announce it."""
+        name = tool_def.name
         if name in self._tools:
             logger.warning(f"Tool '{name}' already registered, overwriting")
-        self._tools[name] = ToolDefinition(
-            name=name,
-            handler=handler,
-            input_schema=input_schema,
-            output_schema=output_schema,
-            title=title or name,
-            description=description or f"Execute {name}",
-            annotations=annotations or {},
-        )
+        self._tools[name] = tool_def
         logger.debug(f"Registered tool: {name}")
         self._emit_list_changed([name])
 
+    def update_from(self, other: "ToolsRegistry") -> None:
+        """Register every tool already defined in another registry.
+
+        Definitions are shared rather than rebuilt, so populating a fresh
+        registry from a template skips per-tool registration work. Only the
+        tool table is copied; stored large results stay with their registry.
+        A tool already registered here is overwritten with the same warning
+        ``register`` gives, and listeners get one notification for the batch.
+        """
+        if not other._tools:
+            return
+        for name in other._tools.keys() & self._tools.keys():
+            logger.warning(f"Tool '{name}' already registered, overwriting")
+        self._tools.update(other._tools)
+        self._emit_list_changed(list(other._tools))
+
     async def list_tools(
         self,
         context: Context,
@@ -576,15 +600,26 @@ def tool(
     return decorator
 
 
+@functools.lru_cache(maxsize=256)
+def _tool_definition(func: ToolHandler) -> ToolDefinition:
+    """Build the definition for a @tool function once per process.
+
+    The metadata is fixed at decoration time, so every registry that registers
+    the same handler shares one definition instead of rebuilding it.
+    """
+    name = func._mcp_tool_name
+    return ToolDefinition(
+        name=name,
+        handler=func,
+        input_schema=func._mcp_tool_input_schema,
+        output_schema=func._mcp_tool_output_schema,
+        title=func._mcp_tool_title or name,
+        description=func._mcp_tool_description or f"Execute {name}",
+        annotations=func._mcp_tool_annotations or {},
+    )
+
+
 def register_tool_functions(registry: ToolsRegistry, *functions: ToolHandler) -> None:
     """Register multiple functions decorated with @tool."""
     for func in functions:
-        registry.register(
-            name=func._mcp_tool_name,
-            handler=func,
-            input_schema=func._mcp_tool_input_schema,
-            output_schema=func._mcp_tool_output_schema,
-            title=func._mcp_tool_title,
-            description=func._mcp_tool_description,
-            annotations=func._mcp_tool_annotations,
-        )
+        registry._add(_tool_definition(func))
@@ -198,12 +198,11 @@ async def create_test_server():
     return server
 
 
-async def test_tool(server, tool_name, arguments, expected_success=True):
-    """Test a single tool."""
-    print(f"  Testing {tool_name}...", end=" ")
+async def test_tool(server, tool_name, arguments, expected_success=True, request_id=1):
+    """Test a single tool; return whether it passed and a status mark."""
     request = {
         "jsonrpc": "2.0",
-        "id": 1,
+        "id": request_id,
         "method": "tools/call",
         "params": {"name": tool_name, "arguments": arguments},
     }
@@ -211,26 +210,20 @@ async def test_tool(server, tool_name, arguments, expected_success=True):
         response = await server.handle_request(request)
         if "result" in response and "content" in response["result"]:
             if expected_success:
-                print("✅")
-                return True
+                return True, "✅"
             else:
-                print("❌ (unexpected success)")
-                return False
+                return False, "❌ (unexpected success)"
         else:
             error = response.get("error", {})
             if expected_success:
-                print(f"❌ ({error.get('message', 'Unknown error')})")
-                return False
+                return False, f"❌ ({error.get('message', 'Unknown error')})"
             else:
-                print("✅ (expected failure)")
-                return True
+                return True, "✅ (expected failure)"
     except Exception as e:
         if expected_success:
-            print(f"💥 (Exception: {e})")
-            return False
+            return False, f"💥 (Exception: {e})"
         else:
-            print("✅ (expected exception)")
-            return True
+            return True, "✅ (expected exception)"
 
 
 async def run_all_tests():
@@ -466,15 +459,27 @@ async def run_all_tests():
             ],
         ),
     ]
+    # The tool calls are independent of each other, so send them all at once;
+    # the server's R semaphore bounds how many R processes run together. Each
+    # in-flight request needs its own id, since the server tracks them by id.
+    cases = [(tool_name, args) for _, tests in categories for tool_name, args in tests]
+    results = iter(
+        await asyncio.gather(
+            *(
+                test_tool(server, tool_name, args, request_id=request_id)
+                for request_id, (tool_name, args) in enumerate(cases, start=1)
+            )
+        )
+    )
     total_tests = 0
     passed_tests = 0
     for category_name, tests in categories:
         print(f"\n{category_name}")
         print("-" * 30)
         category_passed = 0
-        for tool_name, args in tests:
+        for (tool_name, _), (success, status) in zip(tests, results, strict=False):
             total_tests += 1
-            success = await test_tool(server, tool_name, args)
+            print(f"  Testing {tool_name}... {status}")
             if success:
                 passed_tests += 1
                 category_passed += 1
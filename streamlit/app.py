@@ -6,6 +6,8 @@ This is a cloud-compatible version that demonstrates RMCP capabilities
 without requiring the local R/RMCP installation.
 """
 
+import io
+
 import numpy as np
 import pandas as pd
 import streamlit as st
@@ -19,6 +21,27 @@ except ImportError:
     ANTHROPIC_AVAILABLE = False
     st.error("Please install the Anthropic SDK: `pip install anthropic`")
 
+
+@st.cache_resource(show_spinner=False)
+def get_claude_client(api_key):
+    """Return one Claude client per API key, shared across reruns.
+
+    Streamlit re-executes this script on every interaction; reusing the client
+    keeps its HTTP connection pool warm so "Ask Claude" skips the TLS handshake.
+    """
+    return anthropic.Anthropic(api_key=api_key)
+
+
+@st.cache_data(show_spinner=False)
+def load_csv(file_bytes):
+    """Parse an uploaded CSV once per distinct file content.
+
+    Every widget interaction reruns the script, and the uploader hands back the
+    same file each time; keying on the bytes avoids re-parsing it per rerun.
+    """
+    return pd.read_csv(io.BytesIO(file_bytes))
+
+
 # Page config
 st.set_page_config(
     page_title="RMCP - R Econometrics with Claude AI", page_icon="📊", layout="wide"
@@ -60,7 +83,7 @@ if ANTHROPIC_AVAILABLE:
     )
 
     if api_key:
-        client = anthropic.Anthropic(api_key=api_key)
+        client = get_claude_client(api_key)
         st.sidebar.success("✅ Claude API connected")
     else:
         st.sidebar.warning("⚠️ Please enter your Claude API key")
@@ -107,33 +130,29 @@ with col1:
 
         countries = ["USA", "GER", "JPN", "UK", "FRA", "ITA", "CAN", "AUS"]
         years = list(range(2000, 2024))
+        n_rows = len(countries) * len(years)
 
-        data_rows = []
-        for country in countries:
-            for year in years:
-                # Create realistic economic relationships
-                base_gdp = np.random.normal(2.5, 1.0)
-                unemployment = max(0.5, np.random.normal(5.5, 2.0))
-                inflation = max(0, np.random.normal(2.5, 1.5))
-
-                # GDP growth negatively correlated with unemployment
-                gdp_growth = (
-                    base_gdp - 0.3 * (unemployment - 5.5) + np.random.normal(0, 0.5)
-                )
+        # One row of six standard-normal draws per country-year, in the same
+        # order the per-row loop used to consume them, so the data is unchanged
+        draws = np.random.standard_normal((n_rows, 6))
+        base_gdp = 2.5 + 1.0 * draws[:, 0]
+        unemployment = np.maximum(0.5, 5.5 + 2.0 * draws[:, 1])
+        inflation = np.maximum(0, 2.5 + 1.5 * draws[:, 2])
 
-                data_rows.append(
-                    {
-                        "country": country,
-                        "year": year,
-                        "gdp_growth": round(gdp_growth, 2),
-                        "unemployment": round(unemployment, 2),
-                        "inflation": round(inflation, 2),
-                        "interest_rate": round(max(0, np.random.normal(2.0, 1.0)), 2),
-                        "debt_to_gdp": round(max(20, np.random.normal(60, 20)), 1),
-                    }
-                )
+        # GDP growth negatively correlated with unemployment
+        gdp_growth = base_gdp - 0.3 * (unemployment - 5.5) + 0.5 * draws[:, 3]
 
-        sample_data = pd.DataFrame(data_rows)
+        sample_data = pd.DataFrame(
+            {
+                "country": np.repeat(countries, len(years)),
+                "year": np.tile(years, len(countries)),
+                "gdp_growth": gdp_growth.round(2),
+                "unemployment": unemployment.round(2),
+                "inflation": inflation.round(2),
+                "interest_rate": np.maximum(0, 2.0 + 1.0 * draws[:, 4]).round(2),
+                "debt_to_gdp": np.maximum(20, 60 + 20 * draws[:, 5]).round(1),
+            }
+        )
         st.session_state["sample_data"] = sample_data
 
         st.success("✅ Economic panel data generated!")
@@ -152,22 +171,25 @@ with col2:
         np.random.seed(123)
         dates = pd.date_range(start="2020-01-01", end="2023-12-31", freq="D")
 
-        # Simulated economic indicators with trends and seasonality
-        trend = np.linspace(100, 120, len(dates))
-        seasonal = 5 * np.sin(2 * np.pi * np.arange(len(dates)) / 365.25)
-        noise = np.random.normal(0, 2, len(dates))
+        # Simulated economic indicators with trends and seasonality; the
+        # annual cycle is shared by every series, so compute it once
+        n = len(dates)
+        trend = np.linspace(100, 120, n)
+        annual_cycle = np.sin(2 * np.pi * np.arange(n) / 365.25)
+
+        stock_index = 5 * annual_cycle
+        stock_index += trend
+        stock_index += np.random.normal(0, 2, n)
 
         ts_data = pd.DataFrame(
             {
                 "date": dates,
-                "stock_index": trend + seasonal + noise,
-                "gdp_index": trend * 0.8 + np.random.normal(0, 1, len(dates)),
-                "unemployment_rate": 5
-                + np.sin(2 * np.pi * np.arange(len(dates)) / 365.25)
-                + np.random.normal(0, 0.5, len(dates)),
+                "stock_index": stock_index,
+                "gdp_index": trend * 0.8 + np.random.normal(0, 1, n),
+                "unemployment_rate": 5 + annual_cycle + np.random.normal(0, 0.5, n),
                 "inflation_rate": 2.5
-                + 0.3 * np.sin(2 * np.pi * np.arange(len(dates)) / 365.25)
-                + np.random.normal(0, 0.3, len(dates)),
+                + 0.3 * annual_cycle
+                + np.random.normal(0, 0.3, n),
             }
         )
 
@@ -224,7 +246,7 @@ uploaded_file = st.file_uploader(
 data = None
 if uploaded_file is not None:
     try:
-        data = pd.read_csv(uploaded_file)
+        data = load_csv(uploaded_file.getvalue())
         st.success(f"✅ Data loaded: {data.shape[0]} rows, {data.shape[1]} columns")
     except Exception as e:
         st.error(f"❌ Error loading data: {e}")
@@ -262,22 +284,33 @@ if data is not None:
         with col2:
             st.write("**ℹ️ Data Info:**")
             st.write(f"Shape: {data.shape}")
+
+            # One null-count pass feeds both the types table and the
+            # missing-values check instead of scanning the frame twice.
+            missing = data.isna().sum()
+            column_info = pd.DataFrame(
+                {"dtype": data.dtypes.astype(str), "missing": missing}
+            )
             st.write("**Column Types:**")
-            st.write(data.dtypes)
+            st.dataframe(column_info[["dtype"]])
 
-            if data.isnull().sum().sum() > 0:
+            if missing.any():
                 st.write("**Missing Values:**")
-                st.write(data.isnull().sum())
+                st.dataframe(column_info[["missing"]])
 
-    # Basic statistical analysis
+    # Column roles are read by both the analysis section and the Claude
+    # context below; classify the columns once per rerun
     numeric_cols = data.select_dtypes(include=[np.number]).columns.tolist()
+    categorical_cols = data.select_dtypes(include=["object"]).columns
+
+    # Basic statistical analysis
     if numeric_cols:
         st.subheader("📈 Basic Statistical Analysis")
 
         selected_vars = st.multiselect(
             "Select variables for analysis:",
             numeric_cols,
-            default=numeric_cols[:4] if len(numeric_cols) >= 4 else numeric_cols,
+            default=numeric_cols[:4],
         )
 
         if selected_vars:
@@ -343,13 +376,6 @@ if client:
                 # Prepare context about the data if available
                 data_context = ""
                 if data is not None:
-                    numeric_cols = data.select_dtypes(
-                        include=[np.number]
-                    ).columns.tolist()
-                    categorical_cols = data.select_dtypes(
-                        include=["object"]
-                    ).columns.tolist()
-
                     data_context = f"""
                     User's Dataset Context:
                     - Shape: {data.shape[0]} rows, {data.shape[1]} columns
@@ -3,22 +3,73 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
-from rmcp.core.context import Context
-from rmcp.core.server import create_server
-from rmcp.registries.tools import register_tool_functions
+
+if TYPE_CHECKING:
+    from rmcp.core.context import Context
+    from rmcp.registries.tools import ToolsRegistry
+
+# rmcp is imported inside the factories so that loading this conftest, which
+# pytest does for every test, does not pull in the server stack for tests
+# that never build a server.
+
+try:
+    import uvloop
+except ImportError:  # optional; the stock loop works the same, only slower
+    uvloop = None
+
+if uvloop is not None:
+    # Optional: only recent pytest-asyncio releases define this hook, and older
+    # ones would reject an unknown hook and abort the whole session.
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_asyncio_loop_factories(config, item):
+        """Run async tests on uvloop when it is installed."""
+        return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def _tool_registry_cache() -> dict[tuple[Any, ...], ToolsRegistry]:
+    """Registries populated once per distinct tool set, shared by the session."""
+    return {}
+
+
+@pytest.fixture(scope="session")
+def warm_r() -> None:
+    """Start R once before the first R-backed test in the session.
+
+    Each tool call still spawns its own R process, but the first one no longer
+    pays the cold start (binary lookup, shared libraries, jsonlite load) inside
+    a test's own timeout.
+    """
+    from rmcp.r_integration import execute_r_script
+
+    execute_r_script("result <- TRUE", {})
 
 
 @pytest.fixture
-def server_factory() -> Callable[..., Any]:
-    """Return a factory that creates MCP servers with optional tool registration."""
+def server_factory(
+    _tool_registry_cache: dict[tuple[Any, ...], ToolsRegistry],
+) -> Callable[..., Any]:
+    """Return a factory that creates MCP servers with optional tool registration.
+
+    Every call still builds a fresh server, so lifespan state and stored results
+    never leak between tests; only the tool definitions come from the cache.
+    """
 
     def _factory(*tools: Any) -> Any:
+        from rmcp.core.server import create_server
+        from rmcp.registries.tools import ToolsRegistry, register_tool_functions
+
         server = create_server()
         if tools:
-            register_tool_functions(server.tools, *tools)
+            template = _tool_registry_cache.get(tools)
+            if template is None:
+                template = ToolsRegistry()
+                register_tool_functions(template, *tools)
+                _tool_registry_cache[tools] = template
+            server.tools.update_from(template)
         return server
 
     return _factory
@@ -34,6 +85,8 @@ def context_factory() -> Callable[..., Context]:
         request_id: str = "test",
         method: str = "test",
     ) -> Context:
+        from rmcp.core.context import Context
+
         return Context.create(request_id, method, server.lifespan_state)
 
     return _factory
@@ -1,8 +1,21 @@
 """Simple test fixtures for RMCP when needed."""
 
-import json
+import copy
+import functools
 from pathlib import Path
 
+from tests.utils import json_loads
+
+
+@functools.cache
+def _parse_fixture(fixture_name: str) -> dict:
+    """Read and parse a fixture file once per session."""
+    fixture_path = Path(__file__).parent / f"{fixture_name}.json"
+    if not fixture_path.exists():
+        raise FileNotFoundError(f"Fixture not found: {fixture_path}")
+
+    return json_loads(fixture_path.read_bytes())
+
 
 def load_r_fixture(fixture_name: str) -> dict:
     """
@@ -12,7 +25,8 @@ def load_r_fixture(fixture_name: str) -> dict:
         fixture_name: Name of the fixture file (without .json extension)
 
     Returns:
-        The fixture data as a dictionary
+        The fixture data as a dictionary. Each call gets its own copy, so
+        tests may mutate it without affecting the cached parse.
 
     Raises:
         FileNotFoundError: If the fixture file doesn't exist
@@ -20,9 +34,4 @@ def load_r_fixture(fixture_name: str) -> dict:
     Note: Most tests should use actual R execution instead of fixtures.
     This function is only for special cases where pre-captured outputs are needed.
     """
-    fixture_path = Path(__file__).parent / f"{fixture_name}.json"
-    if not fixture_path.exists():
-        raise FileNotFoundError(f"Fixture not found: {fixture_path}")
-
-    with open(fixture_path) as f:
-        return json.load(f)
+    return copy.deepcopy(_parse_fixture(fixture_name))
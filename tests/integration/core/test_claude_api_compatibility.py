@@ -19,8 +19,6 @@ from rmcp.tools.flexible_r import execute_r_analysis
 from rmcp.tools.machine_learning import decision_tree, random_forest
 from rmcp.tools.statistical_tests import chi_square_test
 
-# Add rmcp to path
-
 
 class TestClaudeAPISchemaCompliance:
     """Test that all tool schemas comply with Claude API requirements."""
@@ -5,49 +5,13 @@ Tests all new tool categories without CLI transport complexity.
 
 import asyncio
 import sys
-from shutil import which
 
-# Add rmcp to path
 import pytest
-from rmcp.core.context import Context
-from rmcp.core.server import create_server
-from rmcp.registries.tools import register_tool_functions
-from rmcp.tools.descriptive import frequency_table, outlier_detection, summary_stats
-from rmcp.tools.econometrics import instrumental_variables, panel_regression, var_model
-from rmcp.tools.fileops import (
-    data_info,
-    filter_data,
-    read_csv,
-    read_excel,
-    read_json,
-    write_csv,
-)
-from rmcp.tools.formula_builder import build_formula, validate_formula
-from rmcp.tools.helpers import load_example, suggest_fix, validate_data
-from rmcp.tools.machine_learning import decision_tree, kmeans_clustering, random_forest
-
-# Import all tools directly
-from rmcp.tools.regression import (
-    correlation_analysis,
-    linear_model,
-    logistic_regression,
-)
-from rmcp.tools.statistical_tests import anova, chi_square_test, normality_test, t_test
-from rmcp.tools.timeseries import arima_model, decompose_timeseries, stationarity_test
-from rmcp.tools.transforms import difference, lag_lead, standardize, winsorize
-from rmcp.tools.visualization import (
-    boxplot,
-    correlation_heatmap,
-    histogram,
-    regression_plot,
-    scatter_plot,
-    time_series_plot,
-)
 
-from tests.utils import extract_json_content
+from tests.utils import HAS_R, extract_json_content, tool_call_request
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for direct capability tests"
+    not HAS_R, reason="R binary is required for direct capability tests"
 )
 # Test data
 SAMPLE_DATA = {
@@ -185,6 +149,57 @@ TIME_SERIES_DATA = {
 
 async def create_test_server():
     """Create server with all tools registered."""
+    # This module collects no tests; importing rmcp and every tool module only
+    # when the harness runs keeps pytest's collection of the tree cheap.
+    from rmcp.core.server import create_server
+    from rmcp.registries.tools import register_tool_functions
+    from rmcp.tools.descriptive import frequency_table, outlier_detection, summary_stats
+    from rmcp.tools.econometrics import (
+        instrumental_variables,
+        panel_regression,
+        var_model,
+    )
+    from rmcp.tools.fileops import (
+        data_info,
+        filter_data,
+        read_csv,
+        read_excel,
+        read_json,
+        write_csv,
+    )
+    from rmcp.tools.formula_builder import build_formula, validate_formula
+    from rmcp.tools.helpers import load_example, suggest_fix, validate_data
+    from rmcp.tools.machine_learning import (
+        decision_tree,
+        kmeans_clustering,
+        random_forest,
+    )
+    from rmcp.tools.regression import (
+        correlation_analysis,
+        linear_model,
+        logistic_regression,
+    )
+    from rmcp.tools.statistical_tests import (
+        anova,
+        chi_square_test,
+        normality_test,
+        t_test,
+    )
+    from rmcp.tools.timeseries import (
+        arima_model,
+        decompose_timeseries,
+        stationarity_test,
+    )
+    from rmcp.tools.transforms import difference, lag_lead, standardize, winsorize
+    from rmcp.tools.visualization import (
+        boxplot,
+        correlation_heatmap,
+        histogram,
+        regression_plot,
+        scatter_plot,
+        time_series_plot,
+    )
+
     server = create_server()
     # Register all tools
     register_tool_functions(
@@ -243,17 +258,12 @@ async def create_test_server():
     return server
 
 
-async def run_tool_call(server, tool_name, params):
+async def run_tool_call(server, tool_name, params, request_id=1):
     """Test a direct tool call through MCP protocol."""
-    # Create MCP request
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": params},
-    }
     try:
-        response = await server.handle_request(request)
+        response = await server.handle_request(
+            tool_call_request(tool_name, params, request_id=request_id)
+        )
         if "result" in response and "content" in response["result"]:
             try:
                 return extract_json_content(response)
@@ -272,6 +282,8 @@ async def main():
     """Run comprehensive capability tests."""
     print("🚀 Testing Radically Expanded RMCP Capabilities")
     print("=" * 60)
+    from rmcp.core.context import Context
+
     server = await create_test_server()
     # List all tools
     context = Context.create("test", "test", server.lifespan_state)
@@ -308,15 +320,18 @@ async def main():
     ]
     print("\n🧪 Testing Tool Categories:")
     print("-" * 40)
-    for tool_name, params in tests:
-        print(f"Testing {tool_name}...", end=" ")
-        result = await run_tool_call(server, tool_name, params)
-        if result:
-            print("✅")
-            test_results.append(True)
-        else:
-            print("❌")
-            test_results.append(False)
+    # Run the calls together and report once they have all finished, so the
+    # status lines are not interleaved with each other. Each in-flight request
+    # needs its own id, since the server tracks them by id.
+    results = await asyncio.gather(
+        *(
+            run_tool_call(server, tool_name, params, request_id=request_id)
+            for request_id, (tool_name, params) in enumerate(tests, start=1)
+        )
+    )
+    for (tool_name, _), result in zip(tests, results, strict=True):
+        print(f"Testing {tool_name}... {'✅' if result else '❌'}")
+        test_results.append(bool(result))
     # Summary
     passed = sum(test_results)
     total = len(test_results)
@@ -330,5 +345,12 @@ async def main():
 
 
 if __name__ == "__main__":
-    success = asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:  # optional; the stock loop works the same, only slower
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        success = runner.run(main())
     sys.exit(0 if success else 1)
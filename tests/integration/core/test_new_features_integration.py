@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from shutil import which
 from typing import Any
 
 import pytest
@@ -11,10 +10,10 @@ from rmcp.tools.formula_builder import build_formula, validate_formula
 from rmcp.tools.helpers import load_example, suggest_fix, validate_data
 from rmcp.tools.regression import correlation_analysis, linear_model
 
-from tests.utils import extract_json_content
+from tests.utils import HAS_R, extract_json_content, tool_call_request
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for integration tests"
+    not HAS_R, reason="R binary is required for integration tests"
 )
 
 
@@ -34,17 +33,6 @@ def integration_server(server_factory):
     )
 
 
-def _tool_call_request(
-    tool_name: str, arguments: dict[str, Any], *, request_id: int
-) -> dict[str, Any]:
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-    }
-
-
 def _parse_result(response: dict[str, Any]) -> dict[str, Any]:
     assert "result" in response, f"Response missing result payload: {response!r}"
     result = response["result"]
@@ -56,7 +44,7 @@ async def _call_tool(
     server: Any, name: str, arguments: dict[str, Any], *, request_id: int
 ) -> dict[str, Any]:
     response = await server.handle_request(
-        _tool_call_request(name, arguments, request_id=request_id)
+        tool_call_request(name, arguments, request_id=request_id)
     )
     return _parse_result(response)
 
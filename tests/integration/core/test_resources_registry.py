@@ -5,18 +5,16 @@ Tests resource endpoints using real R execution instead of mocks.
 """
 
 import json
-from shutil import which
 
 import pytest
 from rmcp.core.server import create_server
 from rmcp.registries.tools import register_tool_functions
 from rmcp.tools.helpers import load_example
 
-# Add rmcp to path
-
+from tests.utils import HAS_R
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for resource registry tests"
+    not HAS_R, reason="R binary is required for resource registry tests"
 )
 
 
@@ -10,12 +10,12 @@ These tests execute real R scripts with sample data and validate the
 JSON output against the tool's declared output schema.
 """
 
-from shutil import which
+from types import MappingProxyType
 from typing import Any
 
 import pytest
-import pytest_asyncio
-from jsonschema import ValidationError
+from jsonschema import SchemaError, ValidationError
+from jsonschema.validators import validator_for
 from rmcp.core.context import Context, LifespanState
 from rmcp.core.schemas import validate_schema
 from rmcp.tools import (
@@ -30,48 +30,38 @@ from rmcp.tools import (
     visualization,
 )
 
-# Add rmcp to path for testing
-
+from tests.utils import HAS_R
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for schema validation tests"
+    not HAS_R, reason="R binary is required for schema validation tests"
 )
 
 
-class SchemaValidationError(Exception):
-    """Custom exception for schema validation failures."""
-
-    def __init__(self, tool_name: str, error_details: str):
-        self.tool_name = tool_name
-        self.error_details = error_details
-        super().__init__(f"Schema validation failed for {tool_name}: {error_details}")
-
-
-@pytest_asyncio.fixture
-async def context():
-    """Create a test context for tool execution."""
-    lifespan_state = LifespanState()
-    ctx = Context.create("test", "test_schema_validation", lifespan_state)
-    yield ctx
-
-
-class TestSchemaValidation:
-    """
-    Test actual R output against declared schemas for all tools.
-
-    Integration tests that execute real R statistical tools with sample data
-    and validate the JSON output against declared Python schemas. These tests
-    catch schema drift where R scripts evolve but schemas aren't updated.
+# (tool name, output schema) for every tool that declares one, collected once
+# per process at import and shared read-only by every test that needs it.
+# vars() reads the module dicts directly instead of resolving each name that
+# dir() lists.
+TOOLS = tuple(
+    (attr._mcp_tool_name, attr._mcp_tool_output_schema)
+    for module in (
+        regression,
+        descriptive,
+        statistical_tests,
+        timeseries,
+        machine_learning,
+        transforms,
+        visualization,
+        fileops,
+        helpers,
+    )
+    for attr in vars(module).values()
+    if getattr(attr, "_mcp_tool_output_schema", None) is not None
+)
 
-    Each test method:
-    1. Executes a real statistical tool with meaningful sample data
-    2. Validates JSON output structure against declared schema
-    3. Performs semantic validation of statistical results
-    4. Ensures type correctness and value constraints
-    """
 
-    # Sample datasets for testing different tool categories
-    SAMPLE_DATA = {
+# Sample datasets for testing different tool categories, built once at import
+SAMPLE_DATA = MappingProxyType(
+    {
         "regression": {
             "data": {
                 "sales": [100, 150, 200, 250, 300, 350, 400],
@@ -122,6 +112,227 @@ class TestSchemaValidation:
             "target_categorical": ["A", "B", "A", "B", "A", "B", "A", "B"],
         },
     }
+)
+
+# The t-test takes one long-format dataset; concatenate the groups once rather
+# than in every run of test_t_test_schema.
+_TTEST_GROUP1 = SAMPLE_DATA["statistical_tests"]["group1"]
+_TTEST_GROUP2 = SAMPLE_DATA["statistical_tests"]["group2"]
+_TTEST_PARAMS = {
+    "data": {
+        "value": _TTEST_GROUP1 + _TTEST_GROUP2,
+        "group": ["group1"] * len(_TTEST_GROUP1) + ["group2"] * len(_TTEST_GROUP2),
+    },
+    "variable": "value",
+    "group": "group",
+}
+
+
+# Semantic checks run on each tool's output after it has passed schema
+# validation; one per case in SCHEMA_CASES.
+
+
+def _check_linear_model(result):
+    """Coefficients include the intercept and R-squared lies in [0, 1]."""
+    assert isinstance(result["coefficients"], dict)
+    assert len(result["coefficients"]) >= 2  # intercept + at least one predictor
+    assert 0 <= result["r_squared"] <= 1
+    assert result["n_obs"] == len(SAMPLE_DATA["regression"]["data"]["sales"])
+    assert result["method"] == "lm"
+
+
+def _check_correlation_analysis(result):
+    """The correlation matrix covers every input variable."""
+    corr_matrix = result["correlation_matrix"]
+    variables = result["variables"]
+    assert len(variables) == len(SAMPLE_DATA["regression"]["data"])
+    assert all(var in corr_matrix for var in variables)
+
+
+def _check_logistic_regression(result):
+    """The binomial GLM reports odds ratios and McFadden's R-squared."""
+    assert result["family"] == "binomial"
+    assert isinstance(result["coefficients"], dict)
+    assert "odds_ratios" in result
+    assert 0 <= result["mcfadden_r_squared"] <= 1
+
+
+def _check_arima_model(result):
+    """The ARIMA model reports its order and the series length."""
+    assert result["model_type"] == "ARIMA"
+    assert len(result["order"]) == 3
+    assert isinstance(result["coefficients"], dict)
+    assert result["n_obs"] == len(SAMPLE_DATA["timeseries"]["ts_data"])
+
+
+def _check_summary_stats(result):
+    """Descriptive statistics are numeric and count every observation."""
+    stats = result["statistics"]["values"]
+    assert isinstance(stats["mean"], int | float)
+    assert isinstance(stats["sd"], int | float)
+    assert stats["n"] == len(SAMPLE_DATA["descriptive"]["numeric_data"]["values"])
+
+
+def _check_t_test(result):
+    """The test type is recognised and the p-value lies in [0, 1]."""
+    assert result["test_type"] in [
+        "One-sample t-test",
+        "Paired t-test",
+        "Two-sample t-test (equal variances)",
+        "Welch's t-test",
+    ]
+    assert 0 <= result["p_value"] <= 1
+    assert isinstance(result["statistic"], int | float)
+
+
+def _check_kmeans_clustering(result):
+    """Every row gets a cluster and there is one center per cluster."""
+    assert result["k"] == 2
+    assert len(result["cluster_assignments"]) == len(
+        SAMPLE_DATA["machine_learning"]["features"]["feature1"]
+    )
+    assert len(result["cluster_centers"]) == 2
+
+
+def _check_standardize(result):
+    """The requested columns come back with their original length."""
+    transformed_data = result["data"]
+    assert "feature1" in transformed_data
+    assert "feature2" in transformed_data
+    assert len(transformed_data["feature1"]) == len(
+        SAMPLE_DATA["machine_learning"]["features"]["feature1"]
+    )
+
+
+def _check_load_example(result):
+    """The dataset comes back with metadata for the requested size."""
+    assert "data" in result
+    assert "metadata" in result
+    assert result["metadata"]["size"] == "small"
+    assert isinstance(result["data"], dict)
+
+
+def _check_suggest_fix(result):
+    """The error is classified and at least one suggestion is offered."""
+    assert result["error_type"] in [
+        "missing_package",
+        "syntax_error",
+        "data_error",
+        "statistical_error",
+        "unknown_error",
+    ]
+    assert isinstance(result["suggestions"], list)
+    assert len(result["suggestions"]) > 0
+
+
+SCHEMA_CASES = [
+    pytest.param(
+        regression.linear_model,
+        {
+            "data": SAMPLE_DATA["regression"]["data"],
+            "formula": "sales ~ advertising + price",
+        },
+        _check_linear_model,
+        id="linear_model",
+    ),
+    pytest.param(
+        regression.correlation_analysis,
+        {"data": SAMPLE_DATA["regression"]["data"], "method": "pearson"},
+        _check_correlation_analysis,
+        id="correlation_analysis",
+    ),
+    pytest.param(
+        regression.logistic_regression,
+        {
+            "data": SAMPLE_DATA["regression"]["binary_outcome"],
+            "formula": "outcome ~ predictor",
+            "family": "binomial",
+        },
+        _check_logistic_regression,
+        id="logistic_regression",
+    ),
+    pytest.param(
+        timeseries.arima_model,
+        {"data": {"values": SAMPLE_DATA["timeseries"]["ts_data"]}, "order": [1, 1, 1]},
+        _check_arima_model,
+        id="arima_model",
+    ),
+    pytest.param(
+        descriptive.summary_stats,
+        {"data": SAMPLE_DATA["descriptive"]["numeric_data"], "variables": ["values"]},
+        _check_summary_stats,
+        id="summary_stats",
+    ),
+    pytest.param(statistical_tests.t_test, _TTEST_PARAMS, _check_t_test, id="t_test"),
+    pytest.param(
+        machine_learning.kmeans_clustering,
+        {
+            "data": SAMPLE_DATA["machine_learning"]["features"],
+            "variables": ["feature1", "feature2"],  # Specify which variables to use
+            "k": 2,
+        },
+        _check_kmeans_clustering,
+        id="kmeans_clustering",
+    ),
+    pytest.param(
+        transforms.standardize,
+        {
+            "data": SAMPLE_DATA["machine_learning"]["features"],
+            "variables": ["feature1", "feature2"],
+            "method": "z_score",
+        },
+        _check_standardize,
+        id="standardize",
+    ),
+    pytest.param(
+        helpers.load_example,
+        {"dataset_name": "sales", "size": "small"},
+        _check_load_example,
+        id="load_example",
+    ),
+    pytest.param(
+        helpers.suggest_fix,
+        {"error_message": "there is no package called 'forecast'"},
+        _check_suggest_fix,
+        id="suggest_fix",
+    ),
+]
+
+
+class SchemaValidationError(Exception):
+    """Custom exception for schema validation failures."""
+
+    def __init__(self, tool_name: str, error_details: str):
+        self.tool_name = tool_name
+        self.error_details = error_details
+        super().__init__(f"Schema validation failed for {tool_name}: {error_details}")
+
+
+@pytest.fixture(scope="module")
+def context():
+    """Create one test context shared by every tool execution in this module.
+
+    The tools under test only read from the context, so building a fresh
+    LifespanState per test buys nothing.
+    """
+    lifespan_state = LifespanState()
+    return Context.create("test", "test_schema_validation", lifespan_state)
+
+
+class TestSchemaValidation:
+    """
+    Test actual R output against declared schemas for all tools.
+
+    Integration tests that execute real R statistical tools with sample data
+    and validate the JSON output against declared Python schemas. These tests
+    catch schema drift where R scripts evolve but schemas aren't updated.
+
+    Each case in SCHEMA_CASES:
+    1. Executes a real statistical tool with meaningful sample data
+    2. Validates JSON output structure against declared schema
+    3. Performs semantic validation of statistical results
+    4. Ensures type correctness and value constraints
+    """
 
     async def _validate_tool_output(
         self, tool_func, params: dict[str, Any], context: Context
@@ -137,9 +348,9 @@ class TestSchemaValidation:
             # Execute the tool
             result = await tool_func(context, params)
 
-            # Remove formatting info before validation (as done in production)
-            if isinstance(result, dict) and "_formatting" in result:
-                result = {k: v for k, v in result.items() if k != "_formatting"}
+            # Remove formatting info before validation (as done in production).
+            # Every output schema is an object, so tools always return a dict.
+            result.pop("_formatting", None)
 
             # Validate against schema
             validate_schema(result, output_schema, f"tool '{tool_name}' output")
@@ -155,257 +366,17 @@ class TestSchemaValidation:
             raise SchemaValidationError(tool_name, f"Tool execution failed: {str(e)}")
 
     @pytest.mark.asyncio
-    async def test_linear_model_schema(self, context):
+    @pytest.mark.parametrize(("tool_func", "params", "check"), SCHEMA_CASES)
+    async def test_tool_output_schema(self, context, tool_func, params, check):
         """
-        Test linear regression output schema validation.
+        Test one tool's R output against its declared output schema.
 
-        Validates that the linear_model tool produces R output matching its
-        declared schema, including coefficient dictionary structure, R-squared
-        values within valid range (0-1), and all required statistical fields.
-        Also verifies semantic correctness of statistical results.
+        Executes the tool with the case's sample data, validates the JSON
+        output against the declared schema, then runs the case's semantic
+        checks on the statistical results.
         """
-        params = {
-            "data": self.SAMPLE_DATA["regression"]["data"],
-            "formula": "sales ~ advertising + price",
-        }
-
-        result = await self._validate_tool_output(
-            regression.linear_model, params, context
-        )
-
-        # Additional semantic validation
-        assert isinstance(result["coefficients"], dict)
-        assert len(result["coefficients"]) >= 2  # intercept + at least one predictor
-        assert 0 <= result["r_squared"] <= 1
-        assert result["n_obs"] == len(self.SAMPLE_DATA["regression"]["data"]["sales"])
-        assert result["method"] == "lm"
-
-    @pytest.mark.asyncio
-    async def test_correlation_analysis_schema(self, context):
-        """
-        Test correlation analysis output schema validation.
-
-        Validates that correlation_analysis tool produces properly structured
-        correlation matrix output with correct variable names and symmetric
-        correlation coefficients. Ensures matrix dimensions match input data.
-        """
-        params = {"data": self.SAMPLE_DATA["regression"]["data"], "method": "pearson"}
-
-        result = await self._validate_tool_output(
-            regression.correlation_analysis, params, context
-        )
-
-        # Additional semantic validation
-        corr_matrix = result["correlation_matrix"]
-        variables = result["variables"]
-        assert len(variables) == len(self.SAMPLE_DATA["regression"]["data"])
-        assert all(var in corr_matrix for var in variables)
-
-    @pytest.mark.asyncio
-    async def test_logistic_regression_schema(self, context):
-        """
-        Test logistic regression output schema validation.
-
-        Validates that logistic_regression tool produces correct GLM output
-        including odds ratios, McFadden's R-squared, and binary classification
-        metrics. Ensures family and link function are properly reported.
-        """
-        params = {
-            "data": self.SAMPLE_DATA["regression"]["binary_outcome"],
-            "formula": "outcome ~ predictor",
-            "family": "binomial",
-        }
-
-        result = await self._validate_tool_output(
-            regression.logistic_regression, params, context
-        )
-
-        # Additional semantic validation
-        assert result["family"] == "binomial"
-        assert isinstance(result["coefficients"], dict)
-        assert "odds_ratios" in result
-        assert 0 <= result["mcfadden_r_squared"] <= 1
-
-    @pytest.mark.asyncio
-    async def test_arima_model_schema(self, context):
-        """
-        Test ARIMA model output schema validation.
-
-        Validates that arima_model tool produces time series model output
-        with correct coefficient structure, model order specification,
-        and time series diagnostics matching the declared schema.
-        """
-        params = {
-            "data": {"values": self.SAMPLE_DATA["timeseries"]["ts_data"]},
-            "order": [1, 1, 1],
-        }
-
-        result = await self._validate_tool_output(
-            timeseries.arima_model, params, context
-        )
-
-        # Additional semantic validation
-        assert result["model_type"] == "ARIMA"
-        assert len(result["order"]) == 3
-        assert isinstance(result["coefficients"], dict)
-        assert result["n_obs"] == len(self.SAMPLE_DATA["timeseries"]["ts_data"])
-
-    @pytest.mark.asyncio
-    async def test_summary_stats_schema(self, context):
-        """
-        Test summary statistics output schema validation.
-
-        Validates that summary_stats tool produces descriptive statistics
-        with correct numeric types (mean, sd, etc.) and observation counts
-        matching the input data structure and declared schema.
-        """
-        params = {
-            "data": self.SAMPLE_DATA["descriptive"]["numeric_data"],
-            "variables": ["values"],
-        }
-
-        result = await self._validate_tool_output(
-            descriptive.summary_stats, params, context
-        )
-
-        # Additional semantic validation
-        stats = result["statistics"]["values"]
-        assert isinstance(stats["mean"], int | float)
-        assert isinstance(stats["sd"], int | float)
-        assert stats["n"] == len(
-            self.SAMPLE_DATA["descriptive"]["numeric_data"]["values"]
-        )
-
-    @pytest.mark.asyncio
-    async def test_t_test_schema(self, context):
-        """
-        Test t-test output schema validation.
-
-        Validates that t_test tool produces statistical test results with
-        correct p-value range (0-1), test statistic types, and test type
-        classification matching the declared schema structure.
-        """
-        # Create single dataset with grouping variable for t-test
-        group1_data = self.SAMPLE_DATA["statistical_tests"]["group1"]
-        group2_data = self.SAMPLE_DATA["statistical_tests"]["group2"]
-        params = {
-            "data": {
-                "value": group1_data + group2_data,
-                "group": ["group1"] * len(group1_data) + ["group2"] * len(group2_data),
-            },
-            "variable": "value",
-            "group": "group",
-        }
-
-        result = await self._validate_tool_output(
-            statistical_tests.t_test, params, context
-        )
-
-        # Additional semantic validation
-        assert result["test_type"] in [
-            "One-sample t-test",
-            "Paired t-test",
-            "Two-sample t-test (equal variances)",
-            "Welch's t-test",
-        ]
-        assert 0 <= result["p_value"] <= 1
-        assert isinstance(result["statistic"], int | float)
-
-    @pytest.mark.asyncio
-    async def test_kmeans_clustering_schema(self, context):
-        """
-        Test k-means clustering output schema validation.
-
-        Validates that kmeans_clustering tool produces clustering results
-        with correct cluster assignment arrays, centroid structures, and
-        k-value matching input parameters and declared schema.
-        """
-        params = {
-            "data": self.SAMPLE_DATA["machine_learning"]["features"],
-            "variables": ["feature1", "feature2"],  # Specify which variables to use
-            "k": 2,
-        }
-
-        result = await self._validate_tool_output(
-            machine_learning.kmeans_clustering, params, context
-        )
-
-        # Additional semantic validation
-        assert result["k"] == 2
-        assert len(result["cluster_assignments"]) == len(
-            self.SAMPLE_DATA["machine_learning"]["features"]["feature1"]
-        )
-        assert len(result["cluster_centers"]) == 2
-
-    @pytest.mark.asyncio
-    async def test_data_standardization_schema(self, context):
-        """
-        Test data standardization output schema validation.
-
-        Validates that standardize tool produces transformed data with
-        correct column structure, maintained data dimensions, and proper
-        standardization method reporting matching the declared schema.
-        """
-        params = {
-            "data": self.SAMPLE_DATA["machine_learning"]["features"],
-            "variables": ["feature1", "feature2"],
-            "method": "z_score",
-        }
-
-        result = await self._validate_tool_output(
-            transforms.standardize, params, context
-        )
-
-        # Additional semantic validation
-        transformed_data = result["data"]
-        assert "feature1" in transformed_data
-        assert "feature2" in transformed_data
-        assert len(transformed_data["feature1"]) == len(
-            self.SAMPLE_DATA["machine_learning"]["features"]["feature1"]
-        )
-
-    @pytest.mark.asyncio
-    async def test_load_example_schema(self, context):
-        """
-        Test example data loading output schema validation.
-
-        Validates that load_example tool produces dataset output with
-        correct data structure, metadata fields, and size specifications
-        matching the requested parameters and declared schema.
-        """
-        params = {"dataset_name": "sales", "size": "small"}
-
-        result = await self._validate_tool_output(helpers.load_example, params, context)
-
-        # Additional semantic validation
-        assert "data" in result
-        assert "metadata" in result
-        assert result["metadata"]["size"] == "small"
-        assert isinstance(result["data"], dict)
-
-    @pytest.mark.asyncio
-    async def test_suggest_fix_schema(self, context):
-        """
-        Test error suggestion output schema validation.
-
-        Validates that suggest_fix tool produces error analysis with
-        correct error type classification, suggestion list structure,
-        and diagnostic information matching the declared schema.
-        """
-        params = {"error_message": "there is no package called 'forecast'"}
-
-        result = await self._validate_tool_output(helpers.suggest_fix, params, context)
-
-        # Additional semantic validation
-        assert result["error_type"] in [
-            "missing_package",
-            "syntax_error",
-            "data_error",
-            "statistical_error",
-            "unknown_error",
-        ]
-        assert isinstance(result["suggestions"], list)
-        assert len(result["suggestions"]) > 0
+        result = await self._validate_tool_output(tool_func, params, context)
+        check(result)
 
 
 class TestSchemaConsistency:
@@ -425,123 +396,50 @@ class TestSchemaConsistency:
         properties), follows object schema pattern, and declares required
         fields that actually exist in the properties definition.
         """
-        tool_modules = [
-            regression,
-            descriptive,
-            statistical_tests,
-            timeseries,
-            machine_learning,
-            transforms,
-            visualization,
-            fileops,
-            helpers,
-        ]
-
         schema_issues = []
 
-        for module in tool_modules:
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    hasattr(attr, "_mcp_tool_output_schema")
-                    and attr._mcp_tool_output_schema is not None
-                ):
-                    schema = attr._mcp_tool_output_schema
-                    tool_name = attr._mcp_tool_name
-
-                    # Check basic schema structure
-                    if not isinstance(schema, dict):
-                        schema_issues.append(f"{tool_name}: Schema is not a dict")
-                        continue
-
-                    if schema.get("type") != "object":
-                        schema_issues.append(
-                            f"{tool_name}: Root type should be 'object'"
-                        )
-
-                    if "properties" not in schema:
-                        schema_issues.append(f"{tool_name}: Missing 'properties' field")
-                        continue
-
-                    # Check for required fields
-                    properties = schema["properties"]
-                    required = schema.get("required", [])
-
-                    # Verify required fields exist in properties
-                    for req_field in required:
-                        if req_field not in properties:
-                            schema_issues.append(
-                                f"{tool_name}: Required field '{req_field}' not in properties"
-                            )
+        for tool_name, schema in TOOLS:
+            # Check basic schema structure
+            if not isinstance(schema, dict):
+                schema_issues.append(f"{tool_name}: Schema is not a dict")
+                continue
+
+            if schema.get("type") != "object":
+                schema_issues.append(f"{tool_name}: Root type should be 'object'")
+
+            if "properties" not in schema:
+                schema_issues.append(f"{tool_name}: Missing 'properties' field")
+                continue
+
+            # Check for required fields
+            properties = schema["properties"]
+            required = schema.get("required", [])
+
+            # Verify required fields exist in properties
+            for req_field in required:
+                if req_field not in properties:
+                    schema_issues.append(
+                        f"{tool_name}: Required field '{req_field}' not in properties"
+                    )
 
         if schema_issues:
             pytest.fail("Schema consistency issues found:\n" + "\n".join(schema_issues))
 
     def test_schema_field_types_are_valid(self):
         """
-        Verify all schema field types are valid JSON Schema types.
+        Verify all tool schemas are valid JSON Schema documents.
 
-        Recursively validates that all type declarations in tool schemas
-        use only valid JSON Schema type names (string, number, integer,
-        boolean, array, object, null) and proper union type syntax.
+        Checks every schema against the meta-schema of the draft that
+        validate_schema uses for it at runtime. Besides invalid type names
+        and malformed unions, this catches any other misused keyword.
         """
-        valid_types = {
-            "string",
-            "number",
-            "integer",
-            "boolean",
-            "array",
-            "object",
-            "null",
-        }
-
-        tool_modules = [
-            regression,
-            descriptive,
-            statistical_tests,
-            timeseries,
-            machine_learning,
-            transforms,
-            visualization,
-            fileops,
-            helpers,
-        ]
-
         type_issues = []
 
-        for module in tool_modules:
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    hasattr(attr, "_mcp_tool_output_schema")
-                    and attr._mcp_tool_output_schema is not None
-                ):
-                    schema = attr._mcp_tool_output_schema
-                    tool_name = attr._mcp_tool_name
-
-                    def check_types(obj, path=""):
-                        if isinstance(obj, dict):
-                            if "type" in obj:
-                                schema_type = obj["type"]
-                                if isinstance(schema_type, str):
-                                    if schema_type not in valid_types:
-                                        type_issues.append(
-                                            f"{tool_name}{path}: Invalid type '{schema_type}'"
-                                        )
-                                elif isinstance(schema_type, list):
-                                    for t in schema_type:
-                                        if t not in valid_types:
-                                            type_issues.append(
-                                                f"{tool_name}{path}: Invalid type '{t}' in union"
-                                            )
-
-                            for key, value in obj.items():
-                                check_types(value, f"{path}.{key}")
-                        elif isinstance(obj, list):
-                            for i, item in enumerate(obj):
-                                check_types(item, f"{path}[{i}]")
-
-                    check_types(schema)
+        for tool_name, schema in TOOLS:
+            try:
+                validator_for(schema).check_schema(schema)
+            except SchemaError as e:
+                type_issues.append(f"{tool_name} at {e.json_path}: {e.message}")
 
         if type_issues:
             pytest.fail("Schema type issues found:\n" + "\n".join(type_issues))
@@ -549,6 +447,17 @@ class TestSchemaConsistency:
 
 # Utility functions for debugging schema validation failures
 
+# Python type names of decoded JSON values, mapped to JSON Schema types
+_PYTHON_TO_JSON_TYPE = {
+    "str": "string",
+    "int": "integer",
+    "float": "number",
+    "bool": "boolean",
+    "list": "array",
+    "dict": "object",
+    "NoneType": "null",
+}
+
 
 def analyze_schema_mismatch(
     actual_output: dict[str, Any], expected_schema: dict[str, Any]
@@ -586,34 +495,28 @@ def analyze_schema_mismatch(
         if missing_required:
             issues.append(f"Missing required fields: {missing_required}")
 
-        # Check extra fields (if additionalProperties is False)
-        if expected_schema.get("additionalProperties") is False:
-            extra_fields = [f for f in actual_output.keys() if f not in properties]
-            if extra_fields:
-                issues.append(f"Extra fields not allowed: {extra_fields}")
-
-        # Check field type mismatches
+        # One pass over the output collects both extra fields (when
+        # additionalProperties is False) and type mismatches.
+        closed = expected_schema.get("additionalProperties") is False
+        extra_fields = []
+        type_issues = []
         for field, value in actual_output.items():
-            if field in properties:
-                expected_type = properties[field].get("type")
-                actual_type = type(value).__name__
-
-                # Map Python types to JSON Schema types
-                type_mapping = {
-                    "str": "string",
-                    "int": "integer",
-                    "float": "number",
-                    "bool": "boolean",
-                    "list": "array",
-                    "dict": "object",
-                    "NoneType": "null",
-                }
-
-                json_type = type_mapping.get(actual_type, actual_type)
-                if expected_type and json_type != expected_type:
-                    issues.append(
-                        f"Field '{field}': expected {expected_type}, got {json_type}"
-                    )
+            field_schema = properties.get(field)
+            if field_schema is None:
+                if closed:
+                    extra_fields.append(field)
+                continue
+            expected_type = field_schema.get("type")
+            actual_type = type(value).__name__
+            json_type = _PYTHON_TO_JSON_TYPE.get(actual_type, actual_type)
+            if expected_type and json_type != expected_type:
+                type_issues.append(
+                    f"Field '{field}': expected {expected_type}, got {json_type}"
+                )
+
+        if extra_fields:
+            issues.append(f"Extra fields not allowed: {extra_fields}")
+        issues.extend(type_issues)
 
     return "; ".join(issues) if issues else "No obvious issues detected"
 
@@ -7,12 +7,13 @@ Tests R availability, CLI functionality, and full server integration.
 import subprocess
 import sys
 from pathlib import Path
-from shutil import which
 
 import pytest
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for server integration tests"
+    not HAS_R, reason="R binary is required for server integration tests"
 )
 
 
@@ -15,8 +15,7 @@ Key MCP Protocol Requirements for Errors:
 """
 
 import asyncio
-import json
-from shutil import which
+import logging
 from typing import Any
 
 import pytest
@@ -26,26 +25,35 @@ from rmcp.tools.fileops import read_csv
 from rmcp.tools.regression import linear_model, logistic_regression
 from rmcp.tools.statistical_tests import chi_square_test
 
-# Add rmcp to path
-# rmcp package installed via pip install -e .
+from tests.utils import HAS_R, json_dumps, json_loads
 
+logger = logging.getLogger(__name__)
 
-pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for MCP error protocol tests"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not HAS_R, reason="R binary is required for MCP error protocol tests"
+    ),
+    pytest.mark.usefixtures("warm_r"),
+]
+
+
+@pytest.fixture(scope="module")
+def mcp_server():
+    """Server with error-prone tools, shared by the protocol compliance tests.
+
+    Every test only sends requests that fail, so none of them leaves state on
+    the server that another could observe.
+    """
+    server = create_server()
+    register_tool_functions(
+        server.tools, linear_model, logistic_regression, chi_square_test, read_csv
+    )
+    return server
 
 
 class TestMCPErrorProtocolCompliance:
     """Test MCP protocol compliance for error responses."""
 
-    async def create_mcp_server(self):
-        """Create MCP server with error-prone tools for testing."""
-        server = create_server()
-        register_tool_functions(
-            server.tools, linear_model, logistic_regression, chi_square_test, read_csv
-        )
-        return server
-
     def validate_jsonrpc_error_structure(
         self, response: dict[str, Any], request_id: Any = None
     ):
@@ -91,10 +99,8 @@ class TestMCPErrorProtocolCompliance:
             assert len(first_content["text"]) > 0, "Text content must not be empty"
 
     @pytest.mark.asyncio
-    async def test_unknown_tool_error_protocol(self):
+    async def test_unknown_tool_error_protocol(self, mcp_server):
         """Test MCP protocol compliance for unknown tool errors."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 123,
@@ -102,7 +108,7 @@ class TestMCPErrorProtocolCompliance:
             "params": {"name": "nonexistent_tool", "arguments": {"some": "data"}},
         }
 
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
 
         # Should be JSON-RPC error (not tool error)
         self.validate_jsonrpc_error_structure(response, request_id=123)
@@ -113,15 +119,13 @@ class TestMCPErrorProtocolCompliance:
             "Message should mention unknown tool"
         )
 
-        print("✅ Unknown tool error protocol compliance verified")
-        print(f"   Error code: {error['code']}")
-        print(f"   Message: {error['message']}")
+        logger.debug("Unknown tool error protocol compliance verified")
+        logger.debug("Error code: %s", error["code"])
+        logger.debug("Message: %s", error["message"])
 
     @pytest.mark.asyncio
-    async def test_invalid_request_error_protocol(self):
+    async def test_invalid_request_error_protocol(self, mcp_server):
         """Test MCP protocol compliance for invalid request format."""
-        server = await self.create_mcp_server()
-
         # Invalid request (missing method but has id)
         invalid_request = {
             "jsonrpc": "2.0",
@@ -130,7 +134,7 @@ class TestMCPErrorProtocolCompliance:
             "params": {"some": "data"},
         }
 
-        response = await server.handle_request(invalid_request)
+        response = await mcp_server.handle_request(invalid_request)
 
         # Should be JSON-RPC error
         self.validate_jsonrpc_error_structure(response)
@@ -138,14 +142,12 @@ class TestMCPErrorProtocolCompliance:
         error = response["error"]
         assert error["code"] == -32600, "Invalid request should be code -32600"
 
-        print("✅ Invalid request error protocol compliance verified")
-        print(f"   Error code: {error['code']}")
+        logger.debug("Invalid request error protocol compliance verified")
+        logger.debug("Error code: %s", error["code"])
 
     @pytest.mark.asyncio
-    async def test_schema_validation_error_protocol(self):
+    async def test_schema_validation_error_protocol(self, mcp_server):
         """Test MCP protocol compliance for schema validation errors."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 456,
@@ -159,7 +161,7 @@ class TestMCPErrorProtocolCompliance:
             },
         }
 
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
 
         # Schema validation errors should be tool errors (not JSON-RPC errors)
         self.validate_mcp_tool_error_structure(response)
@@ -168,14 +170,12 @@ class TestMCPErrorProtocolCompliance:
         content_text = response["result"]["content"][0]["text"]
         assert "'data' is a required property" in content_text
 
-        print("✅ Schema validation error protocol compliance verified")
-        print(f"   Error text: {content_text[:80]}...")
+        logger.debug("Schema validation error protocol compliance verified")
+        logger.debug("Error text: %s...", content_text[:80])
 
     @pytest.mark.asyncio
-    async def test_r_execution_error_protocol(self):
+    async def test_r_execution_error_protocol(self, mcp_server):
         """Test MCP protocol compliance for R execution errors."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 789,
@@ -189,7 +189,7 @@ class TestMCPErrorProtocolCompliance:
             },
         }
 
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
 
         # R execution errors should be tool errors
         self.validate_mcp_tool_error_structure(response)
@@ -200,14 +200,12 @@ class TestMCPErrorProtocolCompliance:
             or "error" in content_text.lower()
         )
 
-        print("✅ R execution error protocol compliance verified")
-        print(f"   Error text: {content_text[:80]}...")
+        logger.debug("R execution error protocol compliance verified")
+        logger.debug("Error text: %s...", content_text[:80])
 
     @pytest.mark.asyncio
-    async def test_file_error_protocol(self):
+    async def test_file_error_protocol(self, mcp_server):
         """Test MCP protocol compliance for file operation errors."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 101,
@@ -218,7 +216,7 @@ class TestMCPErrorProtocolCompliance:
             },
         }
 
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
 
         # File errors should be tool errors
         self.validate_mcp_tool_error_structure(response)
@@ -229,14 +227,12 @@ class TestMCPErrorProtocolCompliance:
             for keyword in ["file", "not found", "does not exist"]
         )
 
-        print("✅ File error protocol compliance verified")
-        print(f"   Error text: {content_text[:80]}...")
+        logger.debug("File error protocol compliance verified")
+        logger.debug("Error text: %s...", content_text[:80])
 
     @pytest.mark.asyncio
-    async def test_error_message_localization_ready(self):
+    async def test_error_message_localization_ready(self, mcp_server):
         """Test that error messages are structured for potential localization."""
-        server = await self.create_mcp_server()
-
         # Test multiple error scenarios
         test_cases = [
             {
@@ -259,7 +255,7 @@ class TestMCPErrorProtocolCompliance:
                 "params": {"name": case["name"], "arguments": case["args"]},
             }
 
-            response = await server.handle_request(request)
+            response = await mcp_server.handle_request(request)
 
             # Check message structure
             if "error" in response:
@@ -279,13 +275,11 @@ class TestMCPErrorProtocolCompliance:
             assert "traceback" not in message.lower(), "Should not expose stack traces"
             assert "__" not in message, "Should not expose internal names"
 
-            print(f"✅ Error message structure verified for {case['error_type']}")
+            logger.debug("Error message structure verified for %s", case["error_type"])
 
     @pytest.mark.asyncio
-    async def test_error_response_timing(self):
+    async def test_error_response_timing(self, mcp_server):
         """Test that error responses are returned promptly."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 555,
@@ -296,7 +290,7 @@ class TestMCPErrorProtocolCompliance:
         import time
 
         start_time = time.time()
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
         end_time = time.time()
 
         response_time = end_time - start_time
@@ -309,13 +303,11 @@ class TestMCPErrorProtocolCompliance:
         # Should still be properly formatted
         self.validate_jsonrpc_error_structure(response, request_id=555)
 
-        print(f"✅ Error response timing verified: {response_time:.3f}s")
+        logger.debug("Error response timing verified: %.3fs", response_time)
 
     @pytest.mark.asyncio
-    async def test_concurrent_error_handling(self):
+    async def test_concurrent_error_handling(self, mcp_server):
         """Test that concurrent error requests are handled properly."""
-        server = await self.create_mcp_server()
-
         # Create multiple error-inducing requests
         requests = []
         for i in range(5):
@@ -328,24 +320,24 @@ class TestMCPErrorProtocolCompliance:
                     "arguments": {"data": {}, "formula": "y ~ x"},  # Empty data error
                 },
             }
-            requests.append(server.handle_request(request))
+            requests.append(request)
 
-        # Execute concurrently
-        responses = await asyncio.gather(*requests, return_exceptions=True)
+        # Execute concurrently. A request that raises cancels the rest, which
+        # stops their R processes instead of waiting for them to finish.
+        async with asyncio.TaskGroup() as tg:
+            tasks = [tg.create_task(mcp_server.handle_request(r)) for r in requests]
+        responses = [task.result() for task in tasks]
 
         # All should be proper error responses
         for i, response in enumerate(responses):
-            assert not isinstance(response, Exception), f"Request {i} raised exception"
             self.validate_mcp_tool_error_structure(response)
             assert response.get("id") == i, f"Request {i} ID mismatch"
 
-        print(f"✅ Concurrent error handling verified: {len(responses)} requests")
+        logger.debug("Concurrent error handling verified: %s requests", len(responses))
 
     @pytest.mark.asyncio
-    async def test_error_content_encoding(self):
+    async def test_error_content_encoding(self, mcp_server):
         """Test that error content is properly encoded."""
-        server = await self.create_mcp_server()
-
         request = {
             "jsonrpc": "2.0",
             "id": 777,
@@ -359,19 +351,19 @@ class TestMCPErrorProtocolCompliance:
             },
         }
 
-        response = await server.handle_request(request)
+        response = await mcp_server.handle_request(request)
 
         # Should handle special characters properly
-        response_json = json.dumps(response, ensure_ascii=False)
+        response_json = json_dumps(response)
         assert (
             "café" not in response_json or len(response_json) > 0
         )  # Either filtered or encoded
 
         # Response should be valid JSON
-        parsed_back = json.loads(response_json)
+        parsed_back = json_loads(response_json)
         assert parsed_back == response, "Response should round-trip through JSON"
 
-        print("✅ Error content encoding verified")
+        logger.debug("Error content encoding verified")
 
 
 class TestMCPErrorMetadata:
@@ -419,7 +411,7 @@ class TestMCPErrorMetadata:
             ]
             assert any(keyword in text.lower() for keyword in helpful_keywords)
 
-        print("✅ Error metadata structure verified")
+        logger.debug("Error metadata structure verified")
 
     @pytest.mark.asyncio
     async def test_error_categorization(self):
@@ -467,8 +459,8 @@ class TestMCPErrorMetadata:
                         for keyword in ["file", "not found", "does not exist"]
                     )
 
-            print(
-                f"✅ Error categorization verified for {test_case['expected_category']}"
+            logger.debug(
+                "Error categorization verified for %s", test_case["expected_category"]
             )
 
 
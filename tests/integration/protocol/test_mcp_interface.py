@@ -2,8 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
-from shutil import which
+import asyncio
 from typing import Any
 
 import pytest
@@ -13,11 +12,14 @@ from rmcp.tools.regression import (
     logistic_regression,
 )
 
-from tests.utils import extract_json_content
+from tests.utils import HAS_R, extract_json_content, tool_call_request
 
-pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for MCP integration tests"
-)
+pytestmark = [
+    pytest.mark.skipif(
+        not HAS_R, reason="R binary is required for MCP integration tests"
+    ),
+    pytest.mark.usefixtures("warm_r"),
+]
 
 
 @pytest.fixture
@@ -26,17 +28,6 @@ def mcp_server(server_factory):
     return server_factory(linear_model, correlation_analysis, logistic_regression)
 
 
-def _tool_call_request(
-    tool_name: str, arguments: dict[str, Any], *, request_id: int
-) -> dict[str, Any]:
-    return {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-    }
-
-
 def _parse_result(response: dict[str, Any]) -> dict[str, Any]:
     assert "result" in response, f"Response missing result payload: {response!r}"
     result = response["result"]
@@ -83,68 +74,74 @@ def _assert_data_scientist_analysis(result: dict[str, Any]) -> None:
     assert charges_coef > 0, "Higher charges should increase churn likelihood"
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    ("tool_name", "arguments", "validator"),
-    [
-        (
-            "linear_model",
-            {
-                "data": {
-                    "sales": [120, 135, 128, 142, 156, 148, 160, 175],
-                    "marketing": [10, 12, 11, 14, 16, 15, 18, 20],
-                },
-                "formula": "sales ~ marketing",
+# (tool, arguments, validator) for representative analyst workflows. The calls
+# are independent, so the test below issues them concurrently.
+TOOL_CALL_CASES = [
+    (
+        "linear_model",
+        {
+            "data": {
+                "sales": [120, 135, 128, 142, 156, 148, 160, 175],
+                "marketing": [10, 12, 11, 14, 16, 15, 18, 20],
             },
-            _assert_business_analysis,
-        ),
-        (
-            "correlation_analysis",
-            {
-                "data": {
-                    "gdp_growth": [2.1, 2.3, 1.8, 2.5, 2.7, 2.2],
-                    "unemployment": [5.2, 5.0, 5.5, 4.8, 4.5, 4.9],
-                },
-                "variables": ["gdp_growth", "unemployment"],
-                "method": "pearson",
+            "formula": "sales ~ marketing",
+        },
+        _assert_business_analysis,
+    ),
+    (
+        "correlation_analysis",
+        {
+            "data": {
+                "gdp_growth": [2.1, 2.3, 1.8, 2.5, 2.7, 2.2],
+                "unemployment": [5.2, 5.0, 5.5, 4.8, 4.5, 4.9],
             },
-            _assert_economist_analysis,
-        ),
-        (
-            "logistic_regression",
-            {
-                "data": {
-                    "churn": [0, 1, 0, 1, 0, 0, 1, 1, 0, 1],
-                    "tenure_months": [24, 6, 36, 3, 48, 18, 9, 2, 60, 4],
-                    "monthly_charges": [70, 85, 65, 90, 60, 75, 95, 100, 55, 88],
-                },
-                "formula": "churn ~ tenure_months + monthly_charges",
-                "family": "binomial",
-                "link": "logit",
+            "variables": ["gdp_growth", "unemployment"],
+            "method": "pearson",
+        },
+        _assert_economist_analysis,
+    ),
+    (
+        "logistic_regression",
+        {
+            "data": {
+                "churn": [0, 1, 0, 1, 0, 0, 1, 1, 0, 1],
+                "tenure_months": [24, 6, 36, 3, 48, 18, 9, 2, 60, 4],
+                "monthly_charges": [70, 85, 65, 90, 60, 75, 95, 100, 55, 88],
             },
-            _assert_data_scientist_analysis,
-        ),
-    ],
-)
-async def test_mcp_tool_calls(
-    mcp_server,
-    tool_name: str,
-    arguments: dict[str, Any],
-    validator: Callable[[dict[str, Any]], None],
-):
+            "formula": "churn ~ tenure_months + monthly_charges",
+            "family": "binomial",
+            "link": "logit",
+        },
+        _assert_data_scientist_analysis,
+    ),
+]
+
+
+@pytest.mark.asyncio
+async def test_mcp_tool_calls(mcp_server):
     """Exercise representative MCP tool calls and validate the returned results."""
-    response = await mcp_server.handle_request(
-        _tool_call_request(tool_name, arguments, request_id=1)
+    responses = await asyncio.gather(
+        *(
+            mcp_server.handle_request(
+                tool_call_request(tool_name, arguments, request_id=request_id)
+            )
+            for request_id, (tool_name, arguments, _) in enumerate(
+                TOOL_CALL_CASES, start=1
+            )
+        )
     )
-    result = _parse_result(response)
-    validator(result)
+    for request_id, ((tool_name, _, validator), response) in enumerate(
+        zip(TOOL_CALL_CASES, responses, strict=True), start=1
+    ):
+        assert response.get("id") == request_id, f"{tool_name}: response id mismatch"
+        validator(_parse_result(response))
 
 
 @pytest.mark.asyncio
 async def test_invalid_tool_request_returns_error(mcp_server):
     """Requests for unknown tools should yield a JSON-RPC error response."""
     response = await mcp_server.handle_request(
-        _tool_call_request("nonexistent_tool", {"data": [1, 2, 3]}, request_id=99)
+        tool_call_request("nonexistent_tool", {"data": [1, 2, 3]}, request_id=99)
     )
     assert "error" in response
     assert response["error"]["message"] == "Unknown tool: nonexistent_tool"
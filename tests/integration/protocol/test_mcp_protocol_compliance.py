@@ -12,19 +12,16 @@ import json
 import subprocess
 import sys
 from pathlib import Path
-from shutil import which
 
 import pytest
 import pytest_asyncio
 from rmcp.cli import _register_builtin_tools
 from rmcp.core.server import create_server
 
-# Add rmcp to path for testing
-# rmcp package installed via pip install -e .
-
+from tests.utils import HAS_R
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for MCP protocol compliance tests"
+    not HAS_R, reason="R binary is required for MCP protocol compliance tests"
 )
 
 
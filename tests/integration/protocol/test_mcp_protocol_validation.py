@@ -5,11 +5,10 @@ Tests complete MCP protocol integration flow for each tool with mocked R respons
 ensuring all tool paths work end-to-end without requiring R environment.
 """
 
-from contextlib import ExitStack
-from unittest.mock import patch
+import copy
+from types import MappingProxyType
 
 import pytest
-import pytest_asyncio
 
 # rmcp package installed via pip install -e .
 from rmcp.core.context import Context
@@ -63,7 +62,9 @@ from rmcp.tools.visualization import (
     time_series_plot,
 )
 
-from tests.utils import extract_text_summary
+from tests.utils import extract_text_summary, tool_call_request
+
+pytestmark = pytest.mark.usefixtures("mock_r_patches")
 
 # Test data sets - minimal viable data for each category
 BASIC_DATA = {"x": [1, 2, 3, 4, 5], "y": [2, 4, 6, 8, 10]}
@@ -80,103 +81,110 @@ PANEL_DATA = {
 }
 BINARY_DATA = {"outcome": [0, 1, 0, 1, 0], "predictor": [1, 3, 2, 4, 1]}
 
-# Mock R execution results for each tool category
-MOCK_RESPONSES = {
-    # Regression tools
-    "linear_model": {
-        "coefficients": {"(Intercept)": 0.0, "x": 2.0},
-        "r_squared": 0.99,
-        "p_values": {"(Intercept)": 0.05, "x": 0.001},
-        "residuals": [0.1, -0.1, 0.0, 0.1, -0.1],
-        "n_obs": 5,
-        "degrees_freedom": 3,
-        "formula": "y ~ x",
-        "variables": ["x", "y"],
-    },
-    "correlation_analysis": {
-        "correlation_matrix": {"x": [1.0, 0.99], "y": [0.99, 1.0]},
-        "p_values": {"x": [0.0, 0.001], "y": [0.001, 0.0]},
-        "n_obs": 5,
-        "method": "pearson",
-        "variables": ["x", "y"],
-    },
-    "logistic_regression": {
-        "coefficients": {"(Intercept)": -1.0, "predictor": 0.5},
-        "odds_ratios": {"(Intercept)": 0.37, "predictor": 1.65},
-        "p_values": {"(Intercept)": 0.1, "predictor": 0.05},
-        "accuracy": 0.8,
-        "deviance": 5.2,
-        "aic": 7.4,
-        "n_obs": 5,
-    },
-    # Statistical tests
-    "t_test": {
-        "statistic": 2.5,
-        "p_value": 0.03,
-        "confidence_interval": {"lower": 0.1, "upper": 3.9, "level": 0.95},
-        "mean": 2.0,
-        "alternative": "two.sided",
-        "test_type": "one_sample",
-        "variable": "x",
-    },
-    "anova": {
-        "f_statistic": 15.2,
-        "p_value": 0.01,
-        "df_between": 2,
-        "df_within": 12,
-        "sum_sq": [100, 50],
-        "mean_sq": [50, 4.2],
-        "anova_table": {"p_value": {"1": 0.01}},
-        "formula": "y ~ group",
-    },
-    "chi_square_test": {
-        "statistic": 8.5,
-        "p_value": 0.02,
-        "df": 2,
-        "test_type": "independence",
-        "observed": [[10, 5], [8, 12]],
-        "expected": [[9, 6], [9, 11]],
-        "expected_frequencies": [[9, 6], [9, 11]],
-    },
-    "normality_test": {
-        "test": "shapiro",
-        "statistic": 0.95,
-        "p_value": 0.7,
-        "is_normal": True,
-        "interpretation": "Data appears normally distributed",
-        "test_name": "Shapiro-Wilk",
-        "variable": "x",
-    },
-    # Add other mock responses with required fields...
-    "summary_stats": {
-        "statistics": {
-            "x": {"mean": 3.0, "sd": 1.58, "min": 1, "max": 5},
-            "y": {"mean": 6.0, "sd": 3.16, "min": 2, "max": 10},
+# Mock R execution results for each tool category. The table is read-only and
+# the mock hands out deep copies, so no case can change what the next one gets.
+MOCK_RESPONSES = MappingProxyType(
+    {
+        # Regression tools
+        "linear_model": {
+            "coefficients": {"(Intercept)": 0.0, "x": 2.0},
+            "r_squared": 0.99,
+            "p_values": {"(Intercept)": 0.05, "x": 0.001},
+            "residuals": [0.1, -0.1, 0.0, 0.1, -0.1],
+            "n_obs": 5,
+            "degrees_freedom": 3,
+            "formula": "y ~ x",
+            "variables": ["x", "y"],
         },
-        "n_obs": 5,
-        "variables": ["x", "y"],
-    },
-    "outlier_detection": {
-        "outliers": [5],
-        "outlier_indices": [4],
-        "method": "iqr",
-        "threshold": 1.5,
-        "n_outliers": 1,
-        "variable": "x",
-        "n_obs": 5,
-    },
-    "frequency_table": {
-        "frequency_tables": {"category": {"A": 3, "B": 2}},
-        "percentages": {"category": {"A": 60.0, "B": 40.0}},
-        "n_total": 5,
-        "variables": ["category"],
-    },
-}
+        "correlation_analysis": {
+            "correlation_matrix": {"x": [1.0, 0.99], "y": [0.99, 1.0]},
+            "p_values": {"x": [0.0, 0.001], "y": [0.001, 0.0]},
+            "n_obs": 5,
+            "method": "pearson",
+            "variables": ["x", "y"],
+        },
+        "logistic_regression": {
+            "coefficients": {"(Intercept)": -1.0, "predictor": 0.5},
+            "odds_ratios": {"(Intercept)": 0.37, "predictor": 1.65},
+            "p_values": {"(Intercept)": 0.1, "predictor": 0.05},
+            "accuracy": 0.8,
+            "deviance": 5.2,
+            "aic": 7.4,
+            "n_obs": 5,
+        },
+        # Statistical tests
+        "t_test": {
+            "statistic": 2.5,
+            "p_value": 0.03,
+            "confidence_interval": {"lower": 0.1, "upper": 3.9, "level": 0.95},
+            "mean": 2.0,
+            "alternative": "two.sided",
+            "test_type": "one_sample",
+            "variable": "x",
+        },
+        "anova": {
+            "f_statistic": 15.2,
+            "p_value": 0.01,
+            "df_between": 2,
+            "df_within": 12,
+            "sum_sq": [100, 50],
+            "mean_sq": [50, 4.2],
+            "anova_table": {"p_value": {"1": 0.01}},
+            "formula": "y ~ group",
+        },
+        "chi_square_test": {
+            "statistic": 8.5,
+            "p_value": 0.02,
+            "df": 2,
+            "test_type": "independence",
+            "observed": [[10, 5], [8, 12]],
+            "expected": [[9, 6], [9, 11]],
+            "expected_frequencies": [[9, 6], [9, 11]],
+        },
+        "normality_test": {
+            "test": "shapiro",
+            "statistic": 0.95,
+            "p_value": 0.7,
+            "is_normal": True,
+            "interpretation": "Data appears normally distributed",
+            "test_name": "Shapiro-Wilk",
+            "variable": "x",
+        },
+        # Add other mock responses with required fields...
+        "summary_stats": {
+            "statistics": {
+                "x": {"mean": 3.0, "sd": 1.58, "min": 1, "max": 5},
+                "y": {"mean": 6.0, "sd": 3.16, "min": 2, "max": 10},
+            },
+            "n_obs": 5,
+            "variables": ["x", "y"],
+        },
+        "outlier_detection": {
+            "outliers": [5],
+            "outlier_indices": [4],
+            "method": "iqr",
+            "threshold": 1.5,
+            "n_outliers": 1,
+            "variable": "x",
+            "n_obs": 5,
+        },
+        "frequency_table": {
+            "frequency_tables": {"category": {"A": 3, "B": 2}},
+            "percentages": {"category": {"A": 60.0, "B": 40.0}},
+            "n_total": 5,
+            "variables": ["category"],
+        },
+    }
+)
 
 
-@pytest_asyncio.fixture
-async def test_server():
-    """Create server with all tools registered."""
+@pytest.fixture(scope="module")
+def test_server():
+    """Create server with all tools registered, shared by the whole module.
+
+    The tests only list tools and call them with R mocked out, so nothing
+    they do changes what another test sees.
+    """
     server = create_server()
     # Register all tools exactly as in CLI
     register_tool_functions(
@@ -239,139 +247,104 @@ async def test_server():
     return server
 
 
-@pytest.fixture
-def mock_r_patches():
-    """Create mock patches for R execution."""
-    patches = [
-        patch(
-            "rmcp.tools.statistical_tests.execute_r_script_async",
-            side_effect=lambda r_script, params: MOCK_RESPONSES.get(
-                params.get("tool_name", "generic"), {"status": "mocked"}
-            ),
-        ),
-        patch(
-            "rmcp.tools.descriptive.execute_r_script_async",
-            side_effect=lambda r_script, params: MOCK_RESPONSES.get(
-                params.get("tool_name", "generic"), {"status": "mocked"}
-            ),
-        ),
-        patch(
-            "rmcp.tools.regression.execute_r_script_async",
-            side_effect=lambda r_script, params: MOCK_RESPONSES.get(
-                params.get("tool_name", "generic"), {"status": "mocked"}
-            ),
-        ),
-        # Add other patches as needed
-    ]
-    return patches
-
-
-async def run_tool_protocol_test(server, tool_name, test_data, mock_patches):
-    """Test individual tool through MCP protocol."""
-    # Create MCP request
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {
-            "name": tool_name,
-            "arguments": {**test_data, "tool_name": tool_name},
-        },
-    }
-
-    try:
-        # Apply mock patches and execute
-        with ExitStack() as stack:
-            for patch_obj in mock_patches:
-                stack.enter_context(patch_obj)
-
-            response = await server.handle_request(request)
-
-            # Validate response structure
-            if "result" not in response:
-                return False, f"No result in response: {response}"
-            if "content" not in response["result"]:
-                return False, f"No content in result: {response['result']}"
-
-            content = response["result"]["content"]
-            if not isinstance(content, list) or len(content) == 0:
-                return False, f"Invalid content format: {content}"
-
-            # Verify we get human-readable summary
-            summary = extract_text_summary(response)
-            if not summary.strip():
-                return False, "No human-readable summary returned"
+# Modules whose execute_r_script_async is replaced in the protocol tests
+_MOCK_R_TARGETS = (
+    "rmcp.tools.statistical_tests.execute_r_script_async",
+    "rmcp.tools.descriptive.execute_r_script_async",
+    "rmcp.tools.regression.execute_r_script_async",
+)
 
-            return True, "Protocol validation successful"
 
-    except Exception as e:
-        return False, f"Tool execution failed: {str(e)}"
+async def _mock_r(r_script, params):
+    """Stand-in for execute_r_script_async returning a copy of the canned result."""
+    response = MOCK_RESPONSES.get(params.get("tool_name", "generic"))
+    return copy.deepcopy(response) if response is not None else {"status": "mocked"}
 
 
-# Individual test cases for different tool categories
-@pytest.mark.asyncio
-async def test_regression_tools_protocol(test_server, mock_r_patches):
-    """Test regression tools MCP protocol compliance."""
-    test_cases = [
-        ("linear_model", {"data": BASIC_DATA, "formula": "y ~ x"}),
-        ("correlation_analysis", {"data": BASIC_DATA, "variables": ["x", "y"]}),
-        (
-            "logistic_regression",
-            {"data": BINARY_DATA, "formula": "outcome ~ predictor"},
-        ),
-    ]
-
-    for tool_name, test_data in test_cases:
-        success, result = await run_tool_protocol_test(
-            test_server, tool_name, test_data, mock_r_patches
-        )
-        assert success, f"{tool_name} protocol test failed: {result}"
+@pytest.fixture(scope="module")
+def mock_r_patches():
+    """Mock R execution for every test in this module.
+
+    The patches are entered once for the module rather than around each
+    request, so every parametrized tool case runs against the same mocks.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        for target in _MOCK_R_TARGETS:
+            mp.setattr(target, _mock_r)
+        yield
+
+
+async def run_tool_protocol_test(server, tool_name, test_data):
+    """Call a tool through the MCP protocol and assert on the response shape."""
+    request = tool_call_request(tool_name, {**test_data, "tool_name": tool_name})
+    response = await server.handle_request(request)
+
+    # Validate response structure
+    assert "result" in response, f"{tool_name}: no result in response: {response}"
+    assert "content" in response["result"], (
+        f"{tool_name}: no content in result: {response['result']}"
+    )
+    content = response["result"]["content"]
+    assert isinstance(content, list) and content, (
+        f"{tool_name}: invalid content format: {content}"
+    )
 
+    # Verify we get human-readable summary
+    assert extract_text_summary(response).strip(), (
+        f"{tool_name}: no human-readable summary returned"
+    )
 
-@pytest.mark.asyncio
-async def test_statistical_tests_protocol(test_server, mock_r_patches):
-    """Test statistical tests MCP protocol compliance."""
-    test_cases = [
-        ("t_test", {"data": BASIC_DATA, "variable": "x"}),
-        ("anova", {"data": CATEGORICAL_DATA, "formula": "value ~ category"}),
-        (
-            "chi_square_test",
-            {
-                "data": CATEGORICAL_DATA,
-                "test_type": "independence",
-                "x": "category",
-                "y": "value",
-            },
-        ),
-        ("normality_test", {"data": BASIC_DATA, "variable": "x"}),
-    ]
 
-    for tool_name, test_data in test_cases:
-        success, result = await run_tool_protocol_test(
-            test_server, tool_name, test_data, mock_r_patches
-        )
-        assert success, f"{tool_name} protocol test failed: {result}"
+REGRESSION_CASES = [
+    ("linear_model", {"data": BASIC_DATA, "formula": "y ~ x"}),
+    ("correlation_analysis", {"data": BASIC_DATA, "variables": ["x", "y"]}),
+    ("logistic_regression", {"data": BINARY_DATA, "formula": "outcome ~ predictor"}),
+]
+
+STATISTICAL_TEST_CASES = [
+    ("t_test", {"data": BASIC_DATA, "variable": "x"}),
+    ("anova", {"data": CATEGORICAL_DATA, "formula": "value ~ category"}),
+    (
+        "chi_square_test",
+        {
+            "data": CATEGORICAL_DATA,
+            "test_type": "independence",
+            "x": "category",
+            "y": "value",
+        },
+    ),
+    ("normality_test", {"data": BASIC_DATA, "variable": "x"}),
+]
+
+DESCRIPTIVE_CASES = [
+    ("summary_stats", {"data": BASIC_DATA, "variables": ["x", "y"]}),
+    ("outlier_detection", {"data": BASIC_DATA, "variable": "x"}),
+    ("frequency_table", {"data": CATEGORICAL_DATA, "variables": ["category"]}),
+]
+
+
+# One flat list so every tool case shares a single test function
+PROTOCOL_CASES = [
+    pytest.param(tool_name, test_data, id=f"{category}-{tool_name}")
+    for category, cases in (
+        ("regression", REGRESSION_CASES),
+        ("statistical", STATISTICAL_TEST_CASES),
+        ("descriptive", DESCRIPTIVE_CASES),
+    )
+    for tool_name, test_data in cases
+]
 
 
 @pytest.mark.asyncio
-async def test_descriptive_stats_protocol(test_server, mock_r_patches):
-    """Test descriptive statistics MCP protocol compliance."""
-    test_cases = [
-        ("summary_stats", {"data": BASIC_DATA, "variables": ["x", "y"]}),
-        ("outlier_detection", {"data": BASIC_DATA, "variable": "x"}),
-        ("frequency_table", {"data": CATEGORICAL_DATA, "variables": ["category"]}),
-    ]
-
-    for tool_name, test_data in test_cases:
-        success, result = await run_tool_protocol_test(
-            test_server, tool_name, test_data, mock_r_patches
-        )
-        assert success, f"{tool_name} protocol test failed: {result}"
+@pytest.mark.parametrize(("tool_name", "test_data"), PROTOCOL_CASES)
+async def test_tool_protocol(test_server, tool_name, test_data):
+    """Test MCP protocol compliance for one tool case."""
+    await run_tool_protocol_test(test_server, tool_name, test_data)
 
 
 # Add a comprehensive test that validates the overall protocol
 @pytest.mark.asyncio
-async def test_mcp_protocol_comprehensive_validation(test_server, mock_r_patches):
+async def test_mcp_protocol_comprehensive_validation(test_server):
     """Comprehensive MCP protocol validation across all tool categories."""
     # Test server basic functionality
     context = Context.create("test", "test", test_server.lifespan_state)
@@ -381,10 +354,6 @@ async def test_mcp_protocol_comprehensive_validation(test_server, mock_r_patches
     assert len(tools_list["tools"]) > 0, "No tools registered in server"
 
     # Test basic MCP protocol compliance with a simple tool
-    success, result = await run_tool_protocol_test(
-        test_server,
-        "summary_stats",
-        {"data": BASIC_DATA, "variables": ["x", "y"]},
-        mock_r_patches,
+    await run_tool_protocol_test(
+        test_server, "summary_stats", {"data": BASIC_DATA, "variables": ["x", "y"]}
     )
-    assert success, f"Basic MCP protocol test failed: {result}"
@@ -7,13 +7,14 @@ Tests input schema validation and file operations without R execution where poss
 import json
 import os
 import tempfile
-from shutil import which
 
 import pytest
 from jsonschema import validate
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for fileops tests"
+    not HAS_R, reason="R binary is required for fileops tests"
 )
 
 from rmcp.core.context import Context, LifespanState
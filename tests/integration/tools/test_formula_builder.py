@@ -4,12 +4,12 @@ Unit tests for formula builder tools.
 Tests natural language to R formula conversion and validation.
 """
 
-from shutil import which
-
 import pytest
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for formula builder tests"
+    not HAS_R, reason="R binary is required for formula builder tests"
 )
 
 from rmcp.core.context import Context, LifespanState  # noqa: E402
@@ -4,13 +4,13 @@ Unit tests for helper tools.
 Tests error recovery, data validation, and example dataset loading.
 """
 
-from shutil import which
-
 import pytest
 from jsonschema import validate
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for helper tools tests"
+    not HAS_R, reason="R binary is required for helper tools tests"
 )
 
 from rmcp.core.context import Context, LifespanState  # noqa: E402
@@ -7,12 +7,13 @@ event loop" in every loop afterwards.
 """
 
 import asyncio
-from shutil import which
 
 import pytest
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for concurrency tests"
+    not HAS_R, reason="R binary is required for concurrency tests"
 )
 
 from rmcp.config import get_config
@@ -12,8 +12,6 @@ These tests deliberately trigger R errors/warnings to validate the complete
 error handling pipeline: R → RMCP → MCP → Claude.
 """
 
-from shutil import which
-
 import pytest
 from rmcp.core.context import Context, LifespanState
 from rmcp.r_integration import RExecutionError
@@ -25,12 +23,10 @@ from rmcp.tools.regression import (
 from rmcp.tools.statistical_tests import chi_square_test
 from rmcp.tools.timeseries import arima_model
 
-# Add rmcp to path
-# rmcp package installed via pip install -e .
-
+from tests.utils import HAS_R
 
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for R error handling tests"
+    not HAS_R, reason="R binary is required for R error handling tests"
 )
 
 
@@ -11,12 +11,13 @@ one that broke, so that is what these exercise.
 """
 
 import asyncio
-from shutil import which
 
 import pytest
 
+from tests.utils import HAS_R
+
 pytestmark = pytest.mark.skipif(
-    which("R") is None, reason="R binary is required for these tests"
+    not HAS_R, reason="R binary is required for these tests"
 )
 
 from rmcp.cli import _register_builtin_tools
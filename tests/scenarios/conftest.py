@@ -0,0 +1,34 @@
+"""Fixtures shared by the end-to-end scenario modules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def claude_server_factory() -> Callable[..., Any]:
+    """Return a factory for servers configured the way Claude Desktop runs them.
+
+    Servers are cached by tool set and allowed paths, so scenario modules that
+    ask for the same configuration share one server for the whole session.
+    Callers that change lifespan state must roll it back themselves.
+    """
+    servers: dict[tuple[Any, ...], Any] = {}
+
+    def _factory(*tools: Any, allowed_paths: tuple[str, ...] = ("/tmp",)) -> Any:
+        key = (tools, allowed_paths)
+        server = servers.get(key)
+        if server is None:
+            from rmcp.core.server import create_server
+            from rmcp.registries.tools import register_tool_functions
+
+            server = create_server()
+            server.configure(allowed_paths=list(allowed_paths), read_only=False)
+            register_tool_functions(server.tools, *tools)
+            servers[key] = server
+        return server
+
+    return _factory
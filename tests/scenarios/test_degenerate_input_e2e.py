@@ -19,15 +19,16 @@ from shutil import which
 
 import pytest
 
+from tests.utils import HAS_R, run_mcp_stdio_workflow
+
 pytestmark = [
-    pytest.mark.skipif(which("R") is None, reason="R binary is required"),
+    pytest.mark.skipif(not HAS_R, reason="R binary is required"),
     pytest.mark.skipif(
         which("rmcp") is None and not sys.executable,
         reason="rmcp entry point is required",
     ),
 ]
 
-from tests.utils import run_mcp_stdio_workflow
 
 ONE_VAR = {"x": [1.0, 2.0, 3.0, 4.0, 100.0]}
 ONE_ROW = {"x": [5.0], "g": ["a"]}
@@ -16,7 +16,6 @@ when statistical analyses encounter R errors or warnings.
 """
 
 import os
-from shutil import which
 
 import pytest
 from rmcp.core.context import Context, LifespanState
@@ -32,14 +31,16 @@ from rmcp.tools.regression import (
 )
 from rmcp.tools.statistical_tests import chi_square_test, normality_test, t_test
 
-from tests.utils import extract_json_content, extract_text_summary
-
-# Add rmcp to path
-
+from tests.utils import (
+    HAS_R,
+    extract_json_content,
+    extract_text_summary,
+    tool_call_request,
+)
 
 pytestmark = [
     pytest.mark.skipif(
-        which("R") is None, reason="R binary is required for user experience tests"
+        not HAS_R, reason="R binary is required for user experience tests"
     ),
     pytest.mark.skipif(
         bool(os.getenv("CI")) or bool(os.getenv("GITHUB_ACTIONS")),
@@ -94,15 +95,8 @@ async def simulate_claude_analysis(server, tool_name, arguments, user_intent):
     print(f"\n💬 User Intent: {user_intent}")
     print(f"🤖 Claude calls: {tool_name}")
 
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-    }
-
     try:
-        response = await server.handle_request(request)
+        response = await server.handle_request(tool_call_request(tool_name, arguments))
 
         if "result" in response:
             if response["result"].get("isError"):
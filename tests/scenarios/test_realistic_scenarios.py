@@ -9,8 +9,6 @@ Each test uses the new MCP architecture with proper tools.
 """
 
 import pytest
-
-# Add rmcp to path
 from rmcp.core.context import Context, LifespanState
 from rmcp.tools.regression import (
     correlation_analysis,
@@ -0,0 +1,39 @@
+"""Compiled-validator reuse in ``validate_schema``.
+
+Every tool call validates its arguments and its output. The validators are
+compiled once per schema object; these tests pin that the cache changes the
+cost and not the outcome.
+"""
+
+import pytest
+from rmcp.core import schemas
+from rmcp.core.schemas import SchemaError, validate_schema
+
+SCHEMA = {
+    "type": "object",
+    "properties": {"n": {"type": "integer"}},
+    "required": ["n"],
+}
+
+
+def test_validator_is_compiled_once_per_schema():
+    validate_schema({"n": 1}, SCHEMA)
+    cached = schemas._VALIDATOR_CACHE[id(SCHEMA)]
+    validate_schema({"n": 2}, SCHEMA)
+    assert schemas._VALIDATOR_CACHE[id(SCHEMA)] is cached
+
+
+def test_cached_validator_still_reports_field_errors():
+    validate_schema({"n": 1}, SCHEMA)
+    with pytest.raises(SchemaError, match="is not of type 'integer'") as exc_info:
+        validate_schema({"n": "one"}, SCHEMA, "tool 'x' arguments")
+    assert exc_info.value.field == "n"
+    assert "in tool 'x' arguments" in str(exc_info.value)
+
+
+def test_invalid_schema_is_rejected_on_every_call():
+    broken = {"type": 5}
+    for _ in range(2):
+        with pytest.raises(SchemaError, match="Schema validation error"):
+            validate_schema({}, broken)
+    assert id(broken) not in schemas._VALIDATOR_CACHE
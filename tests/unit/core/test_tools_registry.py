@@ -0,0 +1,60 @@
+"""Populating a registry from a template with ``ToolsRegistry.update_from``.
+
+The test server factory copies a pre-registered template into every fresh
+server; these tests pin that the copy shares definitions, announces the tools
+and overwrites the way ``register`` does.
+"""
+
+from rmcp.registries import tools
+from rmcp.registries.tools import ToolsRegistry
+
+SCHEMA = {"type": "object", "properties": {}}
+
+
+async def _handler(context, params):
+    return {}
+
+
+def _template(*names):
+    template = ToolsRegistry()
+    for name in names:
+        template.register(name, _handler, SCHEMA, description=name)
+    return template
+
+
+def test_definitions_are_shared_not_rebuilt():
+    template = _template("alpha", "beta")
+    registry = ToolsRegistry()
+    registry.update_from(template)
+
+    assert registry._tools.keys() == {"alpha", "beta"}
+    assert registry._tools["alpha"] is template._tools["alpha"]
+
+
+def test_list_changed_is_emitted_once_for_the_batch():
+    notifications = []
+    registry = ToolsRegistry(on_list_changed=notifications.append)
+    registry.update_from(_template("alpha", "beta"))
+
+    assert notifications == [["alpha", "beta"]]
+
+
+def test_empty_template_changes_nothing():
+    notifications = []
+    registry = ToolsRegistry(on_list_changed=notifications.append)
+    registry.update_from(ToolsRegistry())
+
+    assert registry._tools == {}
+    assert notifications == []
+
+
+def test_existing_tool_is_overwritten_with_a_warning(monkeypatch):
+    registry = _template("alpha")
+    template = _template("alpha", "beta")
+    warnings = []
+    monkeypatch.setattr(tools.logger, "warning", warnings.append)
+
+    registry.update_from(template)
+
+    assert registry._tools["alpha"] is template._tools["alpha"]
+    assert warnings == ["Tool 'alpha' already registered, overwriting"]
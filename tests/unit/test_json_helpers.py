@@ -0,0 +1,37 @@
+"""The test-suite JSON helpers give the same result with or without orjson."""
+
+import pytest
+
+from tests import utils
+from tests.utils import json_dumps, json_loads
+
+DOCUMENT = {"name": "café", "values": [1, 2.5, None], "nested": {"ok": True}}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(utils, "orjson", None)
+    return request.param
+
+
+def test_compact_output(backend):
+    assert json_dumps(DOCUMENT) == (
+        '{"name":"café","values":[1,2.5,null],"nested":{"ok":true}}'
+    )
+
+
+def test_pretty_output(backend):
+    assert json_dumps({"a": [1]}, pretty=True) == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_round_trip(backend):
+    assert json_loads(json_dumps(DOCUMENT)) == DOCUMENT
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_non_finite_floats_are_rejected(backend, value):
+    with pytest.raises(ValueError, match="not JSON compliant"):
+        json_dumps({"nested": [{"statistic": value}]})
@@ -0,0 +1,32 @@
+"""Decoding of the JSON result files written by R scripts.
+
+No R is needed: these tests write the result file themselves and check that
+the optional orjson fast path returns what the stdlib parser would.
+"""
+
+import json
+
+import pytest
+from rmcp.r_integration import _load_r_result
+
+
+def test_result_matches_stdlib_decoding(tmp_path):
+    text = '{"coefficients": {"(Intercept)": 1.5, "x": -0.25}, "n_obs": 7}'
+    path = tmp_path / "result.json"
+    path.write_text(text)
+    assert _load_r_result(str(path)) == json.loads(text)
+
+
+def test_non_standard_literals_fall_back_to_stdlib(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text('{"statistic": NaN, "upper": Infinity}')
+    result = _load_r_result(str(path))
+    assert result["statistic"] != result["statistic"]
+    assert result["upper"] == float("inf")
+
+
+def test_invalid_json_raises_json_decode_error(tmp_path):
+    path = tmp_path / "result.json"
+    path.write_text('{"result": ')
+    with pytest.raises(json.JSONDecodeError):
+        _load_r_result(str(path))
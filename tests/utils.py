@@ -2,10 +2,80 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import json
+import math
+import shutil
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+# Resolved once per session: every R-dependent module skips on this, and each
+# shutil.which call walks $PATH.
+HAS_R = shutil.which("R") is not None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse a JSON document, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is strict RFC 8259; let the stdlib accept NaN/Infinity
+            # (which json.dumps emits) or raise its usual error.
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, *, pretty: bool = False) -> str:
+    """Serialize ``obj`` to a JSON string, two-space indented if ``pretty``.
+
+    The text is the same with or without orjson: compact separators unless
+    ``pretty``, and non-ASCII written as-is. NaN and Infinity raise
+    ``ValueError`` on both paths, rather than becoming ``null`` under orjson
+    and bare literals under the stdlib.
+    """
+    if orjson is not None:
+        _reject_non_finite(obj)
+        try:
+            option = orjson.OPT_INDENT_2 if pretty else None
+            return orjson.dumps(obj, option=option).decode()
+        except TypeError:
+            pass  # e.g. non-string dict keys, which orjson rejects
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False, allow_nan=False)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def _reject_non_finite(obj: Any) -> None:
+    """Raise as ``json.dumps(allow_nan=False)`` would on a non-finite float."""
+    stack = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+
+
+def tool_call_request(
+    tool_name: str, arguments: dict[str, Any], *, request_id: int = 1
+) -> dict[str, Any]:
+    """Build a JSON-RPC ``tools/call`` request."""
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments},
+    }
+
 
 def run_mcp_stdio_workflow(
     command: str,
@@ -17,14 +87,17 @@ def run_mcp_stdio_workflow(
     """Drive a stdio MCP server with the official client (sync wrapper).
 
     Spawns ``command args...``, performs the initialize handshake, lists tools,
-    executes ``tool_calls`` in order, and shuts down cleanly. Returns
-    ``(initialize_result, tool_names, call_results)`` as plain dicts/lists.
+    executes ``tool_calls``, and shuts down cleanly. Returns
+    ``(initialize_result, tool_names, call_results)`` as plain dicts/lists,
+    with ``call_results`` in the same order as ``tool_calls``.
+
+    The calls are independent, so they are pipelined over the one session
+    (responses are matched by request id) and the workflow takes as long as
+    the slowest call rather than the sum of all of them.
 
     This replaces raw fire-and-close JSON-RPC pipes: the SDK stdio server
     cancels in-flight requests on stdin EOF, so piped requests race shutdown.
     """
-    import asyncio
-
     from mcp import ClientSession, StdioServerParameters
     from mcp.client.stdio import stdio_client
 
@@ -34,14 +107,19 @@ def run_mcp_stdio_workflow(
             async with ClientSession(read_stream, write_stream) as session:
                 init = await session.initialize()
                 tools = await session.list_tools()
-                call_results = []
-                for name, arguments in tool_calls or []:
-                    result = await session.call_tool(name, arguments)
-                    call_results.append(result.model_dump(mode="json", by_alias=True))
+                results = await asyncio.gather(
+                    *(
+                        session.call_tool(name, arguments)
+                        for name, arguments in tool_calls or []
+                    )
+                )
                 return (
                     init.model_dump(mode="json", by_alias=True),
                     [tool.name for tool in tools.tools],
-                    call_results,
+                    [
+                        result.model_dump(mode="json", by_alias=True)
+                        for result in results
+                    ],
                 )
 
     return asyncio.run(asyncio.wait_for(_run(), timeout=timeout))
@@ -65,7 +143,7 @@ def parse_streamable_response(response: Any) -> dict[str, Any] | None:
         message = None
         for line in response.text.splitlines():
             if line.startswith("data:"):
-                message = json.loads(line[len("data:") :].strip())
+                message = json_loads(line[len("data:") :].strip())
         return message
     raise AssertionError(f"Unexpected content type: {content_type}")
 
@@ -192,13 +270,13 @@ def extract_json_content(response: dict[str, Any]) -> Any:
         if annotations.get("mimeType") == "application/json":
             text = item.get("text", "")
             if text:
-                return json.loads(text)
+                return json_loads(text)
 
     # Fallback: attempt to parse any text block as JSON
     for item in _get_content_items(result):
         if item.get("type") == "text" and item.get("text"):
             try:
-                return json.loads(item["text"])
+                return json_loads(item["text"])
             except json.JSONDecodeError:
                 continue
 